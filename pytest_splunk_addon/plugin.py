@@ -102,6 +102,14 @@ def pytest_sessionstart(session):
     SampleXdistGenerator.tokenized_event_source = session.config.getoption(
         "tokenized_event_source"
     ).lower()
+    SampleXdistGenerator.seed = session.config.getoption("event_seed")
+    SampleXdistGenerator.cache_dir = None
+    if not session.config.getoption("disable_event_cache") and hasattr(
+        session.config, "cache"
+    ):
+        SampleXdistGenerator.cache_dir = str(
+            session.config.cache.mkdir("pytest-splunk-addon-events")
+        )
     if (
         SampleXdistGenerator.tokenized_event_source == "store_new"
         and session.config.getoption("ingest_events").lower()
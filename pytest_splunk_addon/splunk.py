@@ -314,6 +314,20 @@ def pytest_addoption(parser):
         help="One of (new|pregenerated|store_new)",
         default="store_new",
     )
+    group.addoption(
+        "--event-seed",
+        action="store",
+        dest="event_seed",
+        type=int,
+        help="Seed for the random values of the tokenized events. Same seed generates the same events.",
+        default=None,
+    )
+    group.addoption(
+        "--disable-event-cache",
+        action="store_true",
+        dest="disable_event_cache",
+        help="Always generate the tokenized events instead of reusing the ones cached in the previous runs.",
+    )
     group.addoption(
         "--ingest-events",
         action="store",
@@ -321,6 +335,12 @@ def pytest_addoption(parser):
         help="Should ingest events or not (True|False)",
         default="True",
     )
+    group.addoption(
+        "--stream-events",
+        action="store_true",
+        dest="stream_events",
+        help="Ingest the tokenized events as they are generated through bounded queues instead of collecting all of them first.",
+    )
     group.addoption(
         "--execute-test",
         action="store",
@@ -746,6 +766,7 @@ def splunk_ingest_data(request, splunk_hec_uri, sc4s, uf, splunk_events_cleanup)
         }
         thread_count = int(request.config.getoption("thread_count"))
         store_events = request.config.getoption("store_events")
+        stream_events = request.config.getoption("stream_events")
         IngestorHelper.ingest_events(
             ingest_meta_data,
             addon_path,
@@ -753,6 +774,7 @@ def splunk_ingest_data(request, splunk_hec_uri, sc4s, uf, splunk_events_cleanup)
             thread_count,
             store_events,
             run_requirement_test,
+            stream_events,
         )
         sleep(50)
         if "PYTEST_XDIST_WORKER" in os.environ:
@@ -14,9 +14,9 @@
 # limitations under the License.
 #
 from .base_event_ingestor import EventIngestor
+from .streaming import batched, bounded_map
 import requests
 from time import time, mktime
-import concurrent.futures
 import logging
 import os
 
@@ -81,37 +81,37 @@ class HECEventIngestor(EventIngestor):
             ]
 
         Args:
-            events (list): List of events (SampleEvent) to be ingested
+            events (iterable): Events (SampleEvent) to be ingested, consumed
+                lazily in batches of 100 events
 
         """
-        data = list()
-        for event in events:
-
-            event_dict = {
-                "sourcetype": event.metadata.get("sourcetype", "pytest_splunk_addon"),
-                "source": event.metadata.get("source", "pytest_splunk_addon:hec:event"),
-                "event": event.event,
-                "index": event.metadata.get("index", "main"),
-            }
-
-            if event.metadata.get("host_type") in ("plugin", None):
-                host = event.metadata.get("host")
-            else:
-                host = event.key_fields.get("host")[0]
-            if host:
-                event_dict["host"] = host
+        bounded_map(self.__ingest, batched(map(self.get_event_dict, events), 100), 20)
 
-            if event.metadata.get("timestamp_type").lower() == "event":
-                if event.time_values:
-                    event_dict["time"] = event.time_values[0]
-            data.append(event_dict)
+    def get_event_dict(self, event):
+        """
+        Returns the dictionary of the event to be sent to the event endpoint.
 
-        batch_event_list = []
-        for i in range(0, len(data), 100):
-            batch_event_list.append(data[i : i + 100])
+        Args:
+            event (SampleEvent): Event to be ingested
+        """
+        event_dict = {
+            "sourcetype": event.metadata.get("sourcetype", "pytest_splunk_addon"),
+            "source": event.metadata.get("source", "pytest_splunk_addon:hec:event"),
+            "event": event.event,
+            "index": event.metadata.get("index", "main"),
+        }
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-            _ = list(executor.map(self.__ingest, batch_event_list))
+        if event.metadata.get("host_type") in ("plugin", None):
+            host = event.metadata.get("host")
+        else:
+            host = event.key_fields.get("host")[0]
+        if host:
+            event_dict["host"] = host
+
+        if event.metadata.get("timestamp_type").lower() == "event":
+            if event.time_values:
+                event_dict["time"] = event.time_values[0]
+        return event_dict
 
     def __ingest(self, data):
         try:
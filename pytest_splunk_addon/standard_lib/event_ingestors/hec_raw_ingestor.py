@@ -14,9 +14,9 @@
 # limitations under the License.
 #
 from .base_event_ingestor import EventIngestor
+from .streaming import bounded_map
 from time import time
 import requests
-import concurrent.futures
 import logging
 import os
 import time
@@ -78,27 +78,30 @@ class HECRawEventIngestor(EventIngestor):
             }
 
         Args:
-            events (list): List of events (SampleEvent) to be ingested
-            params (dict): dict with the info of the data to be ingested.
+            events (iterable): Events (SampleEvent) to be ingested, consumed lazily
 
         """
-        main_event = []
-        param_list = []
-        for event in events:
-            event_dict = {
-                "sourcetype": event.metadata.get("sourcetype", "pytest_splunk_addon"),
-                "source": event.metadata.get("source", "pytest_splunk_addon:hec:raw"),
-                "index": event.metadata.get("index", "main"),
-            }
+        bounded_map(self.__ingest_event, events, 20)
+
+    def get_params(self, event):
+        """
+        Returns the params of the request of the event.
 
-            if event.metadata.get("host"):
-                event_dict["host"] = event.metadata.get("host")
+        Args:
+            event (SampleEvent): Event to be ingested
+        """
+        event_dict = {
+            "sourcetype": event.metadata.get("sourcetype", "pytest_splunk_addon"),
+            "source": event.metadata.get("source", "pytest_splunk_addon:hec:raw"),
+            "index": event.metadata.get("index", "main"),
+        }
 
-            param_list.append(event_dict)
+        if event.metadata.get("host"):
+            event_dict["host"] = event.metadata.get("host")
+        return event_dict
 
-            main_event.append(event.event)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-            _ = list(executor.map(self.__ingest, main_event, param_list))
+    def __ingest_event(self, event):
+        self.__ingest(event.event, self.get_params(event))
 
     def __ingest(self, event, params):
         try:
@@ -21,7 +21,9 @@ from . import (
     FileMonitorEventIngestor,
 )
 import logging
+import threading
 from ..sample_generation import SampleXdistGenerator
+from .streaming import EventQueue, DEFAULT_QUEUE_SIZE
 
 LOGGER = logging.getLogger("pytest-splunk-addon")
 from .requirement_event_ingester import RequirementEventIngestor
@@ -53,27 +55,84 @@ class IngestorHelper(object):
         LOGGER.debug("Using the following HEC ingestor: {}".format(str(ingestor)))
         return ingestor
 
+    @classmethod
+    def encode_event(cls, event):
+        """
+        Encodes the event as expected by the ingestor of its input_type.
+        """
+        if event.metadata.get("input_type") in [
+            "modinput",
+            "windows_input",
+            "syslog_tcp",
+            "syslog_udp",
+            "uf_file_monitor",
+        ]:
+            event.event = event.event.encode("utf-8").decode()
+        else:
+            event.event = event.event.encode("utf-8")
+
     @classmethod
     def get_consolidated_events(cls, events):
         ingestor_dict = dict()
         for event in events:
             input_type = event.metadata.get("input_type")
-            if input_type in [
-                "modinput",
-                "windows_input",
-                "syslog_tcp",
-                "syslog_udp",
-                "uf_file_monitor",
-            ]:
-                event.event = event.event.encode("utf-8").decode()
-            else:
-                event.event = event.event.encode("utf-8")
+            cls.encode_event(event)
             if input_type in ingestor_dict:
                 ingestor_dict[input_type].append(event)
             else:
                 ingestor_dict[input_type] = [event]
         return ingestor_dict
 
+    @classmethod
+    def stream_events(
+        cls, events, ingest_meta_data, thread_count, queue_size=DEFAULT_QUEUE_SIZE
+    ):
+        """
+        Ingests the events as they are generated. Each input type has its
+        ingestor running in a thread, fed through a bounded queue, so only
+        queue_size events per input type are held at a time.
+
+        Args:
+            events (iterable): Events (SampleEvent) to be ingested, consumed lazily
+            ingest_meta_data (dict): Dictionary of required meta_data
+            thread_count (int): No. of threads of each ingestor
+            queue_size (int): Maximum number of events waiting for each ingestor
+
+        Raises:
+            Exception: The first error of the ingestors
+        """
+        event_queues = dict()
+        ingestor_threads = list()
+        try:
+            for event in events:
+                input_type = event.metadata.get("input_type")
+                if input_type not in event_queues:
+                    LOGGER.debug(
+                        "Streaming the events of input type: {}".format(input_type)
+                    )
+                    event_ingestor = cls.get_event_ingestor(
+                        input_type, ingest_meta_data
+                    )
+                    event_queue = EventQueue(queue_size)
+                    ingestor_thread = threading.Thread(
+                        target=event_queue.consume,
+                        args=(event_ingestor, thread_count),
+                        daemon=True,
+                    )
+                    ingestor_thread.start()
+                    event_queues[input_type] = event_queue
+                    ingestor_threads.append(ingestor_thread)
+                cls.encode_event(event)
+                event_queues[input_type].put(event)
+        finally:
+            for event_queue in event_queues.values():
+                event_queue.close()
+            for ingestor_thread in ingestor_threads:
+                ingestor_thread.join()
+        for event_queue in event_queues.values():
+            if event_queue.error:
+                raise event_queue.error
+
     @classmethod
     def ingest_events(
         cls,
@@ -83,6 +142,7 @@ class IngestorHelper(object):
         thread_count,
         store_events,
         run_requirement_test,
+        stream_events=False,
     ):
         """
         Events are ingested in the splunk.
@@ -92,25 +152,17 @@ class IngestorHelper(object):
             config_path: Path to pytest-splunk-addon-sample-generator.conf.
             bulk_event_ingestion(bool): Boolean param for bulk event ingestion.
             run_requirement_test(bool) :Boolean to identify if we want to run the requirement tests
+            stream_events(bool): Stream the events to the ingestors as they are generated
+                instead of collecting all of them first.
         """
         sample_generator = SampleXdistGenerator(addon_path, config_path)
-        store_sample = sample_generator.get_samples(store_events)
+        store_sample = sample_generator.get_samples(store_events, stream=stream_events)
         tokenized_events = store_sample.get("tokenized_events")
-        ingestor_dict = cls.get_consolidated_events(tokenized_events)
-        for input_type, events in ingestor_dict.items():
-            LOGGER.debug(
-                "Received the following input type for HEC event: {}".format(input_type)
-            )
-            event_ingestor = cls.get_event_ingestor(input_type, ingest_meta_data)
-            event_ingestor.ingest(events, thread_count)
-
-        if run_requirement_test != "None":
-            requirement_events = RequirementEventIngestor(run_requirement_test)
-            requirement_events_get = requirement_events.get_events()
-            requirement_events_dict = cls.get_consolidated_events(
-                requirement_events_get
-            )
-            for input_type, events in requirement_events_dict.items():
+        if stream_events:
+            cls.stream_events(tokenized_events, ingest_meta_data, thread_count)
+        else:
+            ingestor_dict = cls.get_consolidated_events(tokenized_events)
+            for input_type, events in ingestor_dict.items():
                 LOGGER.debug(
                     "Received the following input type for HEC event: {}".format(
                         input_type
@@ -118,4 +170,26 @@ class IngestorHelper(object):
                 )
                 event_ingestor = cls.get_event_ingestor(input_type, ingest_meta_data)
                 event_ingestor.ingest(events, thread_count)
+
+        if run_requirement_test != "None":
+            requirement_events = RequirementEventIngestor(run_requirement_test)
+            requirement_events_get = requirement_events.get_events()
+            if stream_events:
+                cls.stream_events(
+                    requirement_events_get, ingest_meta_data, thread_count
+                )
+            else:
+                requirement_events_dict = cls.get_consolidated_events(
+                    requirement_events_get
+                )
+                for input_type, events in requirement_events_dict.items():
+                    LOGGER.debug(
+                        "Received the following input type for HEC event: {}".format(
+                            input_type
+                        )
+                    )
+                    event_ingestor = cls.get_event_ingestor(
+                        input_type, ingest_meta_data
+                    )
+                    event_ingestor.ingest(events, thread_count)
             LOGGER.info("Ingestion Done")
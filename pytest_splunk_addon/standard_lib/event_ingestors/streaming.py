@@ -0,0 +1,143 @@
+#
+# Copyright 2021 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Helpers to ingest the events as they are generated, keeping only a bounded
+number of them in memory.
+"""
+import queue
+import logging
+import concurrent.futures
+from collections import deque
+from itertools import islice
+
+LOGGER = logging.getLogger("pytest-splunk-addon")
+
+# Maximum number of events waiting in the queue of an ingestor
+DEFAULT_QUEUE_SIZE = 1000
+# Seconds to wait for the queue before checking the ingestor again
+POLL_INTERVAL = 0.1
+
+_END = object()
+
+
+def batched(items, batch_size):
+    """
+    Yields lists of batch_size items, the last one may be shorter.
+
+    Args:
+        items (iterable): Items to batch, consumed lazily
+        batch_size (int): No. of items in each batch
+    """
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def bounded_map(func, items, max_workers):
+    """
+    Calls func for each item in a thread pool, like ThreadPoolExecutor.map,
+    but submits the items only as the previous ones complete so at most
+    twice max_workers items are in memory at a time.
+
+    Args:
+        func (callable): Function called with each item
+        items (iterable): Items, consumed lazily
+        max_workers (int): No. of threads
+
+    Raises:
+        Exception: The first exception raised by func
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for each_item in items:
+            if len(pending) >= 2 * max_workers:
+                pending.popleft().result()
+            pending.append(executor.submit(func, each_item))
+        while pending:
+            pending.popleft().result()
+
+
+class EventQueue(object):
+    """
+    Bounded queue of the events of an ingestor, consumed by iterating over it.
+
+    put blocks while the queue is full, so the events are generated only as
+    fast as the ingestor consumes them. If the ingestor fails, the error is
+    raised to the producer by the next put.
+
+    Args:
+        maxsize (int): Maximum number of events waiting in the queue
+    """
+
+    def __init__(self, maxsize=DEFAULT_QUEUE_SIZE):
+        self._queue = queue.Queue(maxsize)
+        self.error = None
+        self.consumed = False
+
+    def put(self, event):
+        """
+        Adds the event, waiting for the ingestor if the queue is full.
+
+        Args:
+            event (SampleEvent): Event to ingest
+
+        Raises:
+            Exception: The error of the ingestor, if it failed
+        """
+        self._put(event)
+        if self.error:
+            raise self.error
+
+    def close(self):
+        """
+        Marks the end of the events, the iteration stops after the last one.
+        """
+        self._put(_END)
+
+    def _put(self, item):
+        while not (self.error or self.consumed):
+            try:
+                self._queue.put(item, timeout=POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self):
+        while True:
+            event = self._queue.get()
+            if event is _END:
+                return
+            yield event
+
+    def consume(self, event_ingestor, thread_count):
+        """
+        Ingests the events of the queue with event_ingestor, until the queue
+        is closed. Used as the target of the ingestor thread.
+
+        Args:
+            event_ingestor (EventIngestor): Ingestor of the events
+            thread_count (int): No. of threads of the ingestor
+        """
+        try:
+            event_ingestor.ingest(self, thread_count)
+        except Exception as e:
+            LOGGER.error("Ingestion of the streamed events failed: {}".format(e))
+            self.error = e
+        finally:
+            self.consumed = True
@@ -0,0 +1,205 @@
+#
+# Copyright 2021 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Columnar, memory-mapped store of the tokenized events shared by the xdist workers.
+"""
+import json
+import mmap
+import struct
+import logging
+from array import array
+
+from . import SampleEvent
+
+LOGGER = logging.getLogger("pytest-splunk-addon")
+
+MAGIC = b"PSAEVT01"
+HEADER_LENGTH = struct.Struct("<Q")
+COLUMNS = [
+    "event_offsets",
+    "sample_name_index",
+    "metadata_index",
+    "key_fields_index",
+    "time_values_index",
+]
+
+
+class EventStore(object):
+    """
+    Read-only view of the tokenized events written by EventStore.write.
+
+    The file contains, in this order:
+
+        * MAGIC and the length of the JSON header
+        * JSON header: conf_name, event count, the interned tables of
+          sample names, metadata, key fields and time values (JSON strings)
+          and the position of each column
+        * Columns: native int64 arrays, one entry per event (event_offsets
+          has one more), indexing the event blob and the tables
+        * Event blob: UTF-8 content of all the events
+
+    The file is mapped read-only, the events are materialized as SampleEvent
+    only when they are accessed. Events sharing the same metadata share the
+    same metadata dictionary, same as the events of a SampleStanza.
+
+    Args:
+        file_path (str): Path of the file written by EventStore.write
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        with open(file_path, "rb") as file_obj:
+            self._mmap = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(MAGIC)] != MAGIC:
+            raise ValueError("{} is not an event store".format(file_path))
+        (header_length,) = HEADER_LENGTH.unpack_from(self._mmap, len(MAGIC))
+        header_start = len(MAGIC) + HEADER_LENGTH.size
+        header = json.loads(
+            self._mmap[header_start : header_start + header_length].decode("utf-8")
+        )
+        self.conf_name = header["conf_name"]
+        self.event_count = header["event_count"]
+        self._tables = header["tables"]
+        self._metadata = {}
+        view = memoryview(self._mmap)
+        self._columns = {
+            name: view[start:end].cast("q")
+            for name, (start, end) in header["columns"].items()
+        }
+        self._blob_start = header["blob_start"]
+
+    @staticmethod
+    def write(file_path, conf_name, tokenized_events):
+        """
+        Writes the tokenized events to file_path.
+
+        Args:
+            file_path (str): Path of the event store file
+            conf_name (str): Name of the conf file, "psa-data-gen"
+            tokenized_events (list): List of SampleEvent objects
+        """
+        tables = {
+            "sample_names": {},
+            "metadata": {},
+            "key_fields": {},
+            "time_values": {},
+        }
+        columns = {name: array("q") for name in COLUMNS}
+        blob = []
+        blob_size = 0
+        columns["event_offsets"].append(0)
+
+        def intern(table, value):
+            return tables[table].setdefault(value, len(tables[table]))
+
+        for each_event in tokenized_events:
+            event = each_event.event
+            if isinstance(event, str):
+                event = event.encode("utf-8")
+            blob.append(event)
+            blob_size += len(event)
+            columns["event_offsets"].append(blob_size)
+            columns["sample_name_index"].append(
+                intern("sample_names", each_event.sample_name)
+            )
+            for table in ("metadata", "key_fields", "time_values"):
+                columns["{}_index".format(table)].append(
+                    intern(table, json.dumps(getattr(each_event, table)))
+                )
+
+        # Column positions relative to the end of the header
+        relative_columns = {}
+        position = 0
+        for name in COLUMNS:
+            size = len(columns[name]) * columns[name].itemsize
+            relative_columns[name] = (position, position + size)
+            position += size
+        header = {
+            "conf_name": conf_name,
+            "event_count": len(columns["sample_name_index"]),
+            "tables": {table: list(values) for table, values in tables.items()},
+        }
+        header_bytes = EventStore._get_header(header, relative_columns, position)
+        with open(file_path, "wb") as file_obj:
+            file_obj.write(MAGIC)
+            file_obj.write(HEADER_LENGTH.pack(len(header_bytes)))
+            file_obj.write(header_bytes)
+            for name in COLUMNS:
+                columns[name].tofile(file_obj)
+            for each_event in blob:
+                file_obj.write(each_event)
+        LOGGER.info("Stored {} events in {}".format(header["event_count"], file_path))
+
+    @staticmethod
+    def _get_header(header, relative_columns, columns_size):
+        """
+        Returns the encoded header with the absolute positions of the columns.
+        The header is padded so the columns start at a multiple of 8 bytes.
+        """
+        header_start = len(MAGIC) + HEADER_LENGTH.size
+        header_length = 0
+        while True:
+            columns_start = header_start + header_length
+            header["columns"] = {
+                name: (columns_start + start, columns_start + end)
+                for name, (start, end) in relative_columns.items()
+            }
+            header["blob_start"] = columns_start + columns_size
+            header_bytes = json.dumps(header).encode("utf-8")
+            if len(header_bytes) <= header_length:
+                return header_bytes.ljust(header_length)
+            # The positions only grow with header_length, retry with the new size
+            header_length = (len(header_bytes) + 7) // 8 * 8
+
+    def _get_metadata(self, index):
+        if index not in self._metadata:
+            self._metadata[index] = json.loads(self._tables["metadata"][index])
+        return self._metadata[index]
+
+    def __len__(self):
+        return self.event_count
+
+    def __getitem__(self, index):
+        """
+        Materializes the event at index.
+
+        Args:
+            index (int): Index of the event
+        """
+        if index < 0:
+            index += self.event_count
+        if not 0 <= index < self.event_count:
+            raise IndexError("event index out of range")
+        offsets = self._columns["event_offsets"]
+        event_string = self._mmap[
+            self._blob_start + offsets[index] : self._blob_start + offsets[index + 1]
+        ].decode("utf-8")
+        sample_event = SampleEvent(
+            event_string,
+            self._get_metadata(self._columns["metadata_index"][index]),
+            self._tables["sample_names"][self._columns["sample_name_index"][index]],
+        )
+        sample_event.key_fields = json.loads(
+            self._tables["key_fields"][self._columns["key_fields_index"][index]]
+        )
+        sample_event.time_values = json.loads(
+            self._tables["time_values"][self._columns["time_values_index"][index]]
+        )
+        return sample_event
+
+    def __iter__(self):
+        for index in range(self.event_count):
+            yield self[index]
@@ -84,10 +84,13 @@ class PytestSplunkAddonDataParser:
             LOGGER.warning(f"{PSA_DATA_CONFIG_FILE} not found")
             raise FileNotFoundError(f"{PSA_DATA_CONFIG_FILE} not found")
 
-    def get_sample_stanzas(self):
+    def get_sample_stanzas(self, value_counter=None):
         """
         Converts a stanza in pytest-splunk-addon-data.conf to an object of SampleStanza.
 
+        Args:
+            value_counter (ValueCounter): Counter shared by all the stanzas for the unique values
+
         Returns:
             List of SampleStanza objects.
         """
@@ -96,7 +99,7 @@ class PytestSplunkAddonDataParser:
         results = []
         for sample_name, stanza_params in sorted(_psa_data.items()):
             sample_path = os.path.join(self._path_to_samples(), sample_name)
-            results.append(SampleStanza(sample_path, stanza_params))
+            results.append(SampleStanza(sample_path, stanza_params, value_counter))
         return results
 
     def _get_psa_data_stanzas(self):
@@ -0,0 +1,175 @@
+#
+# Copyright 2021 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Shared Faker instances and batched generation of the random values of the rules.
+
+The values are generated from the random module, so they follow the seed
+set by ValueCounter.seed_random the same way the Faker values do.
+"""
+import uuid
+import random
+import threading
+from ipaddress import IPv6Address
+
+from faker import Faker
+
+HEX_DIGITS = "0123456789abcdef"
+
+
+class FakerPool(object):
+    """
+    Process-wide Faker instances, one per locale.
+    Creating a Faker loads all its providers, so the instances are created
+    once and shared by all the rules and events of the process.
+    Faker.seed seeds the random generator shared by all the instances.
+    """
+
+    def __init__(self):
+        self._fakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, locale=None):
+        """
+        Returns the Faker instance of the locale.
+
+        Args:
+            locale (str): Locale of the Faker, default locale if None
+        """
+        with self._lock:
+            if locale not in self._fakers:
+                self._fakers[locale] = Faker(locale)
+            return self._fakers[locale]
+
+
+FAKER_POOL = FakerPool()
+
+
+def random_chunks(size, count):
+    """
+    Returns count random byte strings of size bytes drawn at once.
+
+    Args:
+        size (int): No. of bytes of each chunk
+        count (int): No. of chunks
+    """
+    if count <= 0:
+        return []
+    data = random.getrandbits(8 * size * count).to_bytes(size * count, "big")
+    return [data[index : index + size] for index in range(0, len(data), size)]
+
+
+def random_ipv4(count):
+    """
+    Returns count random ipv4 addresses. Addresses of the unspecified,
+    loopback, link-local, multicast and reserved networks are drawn again.
+
+    Args:
+        count (int): No. of addresses
+    """
+    addresses = []
+    while len(addresses) < count:
+        for chunk in random_chunks(4, count - len(addresses)):
+            if (
+                chunk[0] in (0, 127)
+                or chunk[0] >= 224
+                or (chunk[0] == 169 and chunk[1] == 254)
+            ):
+                continue
+            addresses.append("{}.{}.{}.{}".format(*chunk))
+    return addresses
+
+
+def random_ipv6(count):
+    """
+    Returns count random ipv6 addresses, out of the ipv4 compatible range.
+
+    Args:
+        count (int): No. of addresses
+    """
+    return [
+        str(IPv6Address(max(int.from_bytes(chunk, "big"), 2 ** 32)))
+        for chunk in random_chunks(16, count)
+    ]
+
+
+def random_mac(count):
+    """
+    Returns count random unicast mac addresses.
+
+    Args:
+        count (int): No. of addresses
+    """
+    return [
+        ":".join(
+            "{:02x}".format(octet & 0xFE if index == 0 else octet)
+            for index, octet in enumerate(chunk)
+        )
+        for chunk in random_chunks(6, count)
+    ]
+
+
+def random_guid(count):
+    """
+    Returns count random version 4 guids.
+
+    Args:
+        count (int): No. of guids
+    """
+    # uuid4 is read from os.urandom, use random to follow the seed
+    return [
+        str(uuid.UUID(bytes=chunk, version=4)) for chunk in random_chunks(16, count)
+    ]
+
+
+def random_hex(count):
+    """
+    Returns a string of count random hex digits.
+
+    Args:
+        count (int): No. of digits
+    """
+    if count <= 0:
+        return ""
+    return "{:0{}x}".format(random.getrandbits(4 * count), count)
+
+
+def random_int(lower_limit, upper_limit, count):
+    """
+    Returns count random integers between lower_limit and upper_limit, both included.
+
+    Args:
+        lower_limit (int): Lower limit of the integers
+        upper_limit (int): Upper limit of the integers
+        count (int): No. of integers
+    """
+    return random.choices(range(lower_limit, upper_limit + 1), k=count)
+
+
+def random_float(lower_limit, upper_limit, count):
+    """
+    Returns count random floats between lower_limit and upper_limit.
+
+    Args:
+        lower_limit (float): Lower limit of the floats
+        upper_limit (float): Upper limit of the floats
+        count (int): No. of floats
+    """
+    # 53 random bits of each 7 bytes chunk, the precision of a float
+    return [
+        lower_limit
+        + (upper_limit - lower_limit) * ((int.from_bytes(chunk, "big") >> 3) / 2 ** 53)
+        for chunk in random_chunks(7, count)
+    ]
@@ -0,0 +1,189 @@
+#
+# Copyright 2021 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import logging
+import threading
+from collections import OrderedDict
+
+LOGGER = logging.getLogger("pytest-splunk-addon")
+
+# Total size of the replacement files kept in memory
+MAX_CACHE_SIZE = 256 * 1024 * 1024
+
+
+class ReplacementFile(object):
+    """
+    Parsed content of a replacement file used by FileRule.
+    Each view of the content is parsed on first use only.
+
+    Args:
+        text (str): Content of the file
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self._lines = None
+        self._data = None
+        self._rows = None
+        self._lookup_rows = None
+        self._lookup_data = None
+        self._column_index = None
+
+    @property
+    def lines(self):
+        """
+        Stripped lines of the file, for the file replacement without index
+        """
+        if self._lines is None:
+            self._lines = [each.strip() for each in self.text.split("\n") if each]
+        return self._lines
+
+    @property
+    def data(self):
+        """
+        Non empty stripped lines of the file, for the indexed replacement
+        """
+        if self._data is None:
+            self._data = [
+                each.strip() for each in self.text.split("\n") if each.strip() != ""
+            ]
+        return self._data
+
+    @property
+    def rows(self):
+        """
+        Comma separated values of each line in data
+        """
+        if self._rows is None:
+            self._rows = [each.split(",") for each in self.data]
+        return self._rows
+
+    @property
+    def header(self):
+        """
+        First line of the file along with its line break, for the lookup replacement
+        """
+        first_line, line_break, _ = self.text.partition("\n")
+        return first_line + line_break
+
+    @property
+    def lookup_data(self):
+        """
+        Non empty stripped lines after the header
+        """
+        if self._lookup_data is None:
+            self._lookup_data = [
+                each.strip() for each in self.text.split("\n")[1:] if each.strip() != ""
+            ]
+        return self._lookup_data
+
+    @property
+    def lookup_rows(self):
+        """
+        Comma separated values of each line in lookup_data
+        """
+        if self._lookup_rows is None:
+            self._lookup_rows = [each.split(",") for each in self.lookup_data]
+        return self._lookup_rows
+
+    def get_column_index(self, column):
+        """
+        Returns the index of the column in the header.
+
+        Args:
+            column (str): Name of the column
+
+        Raises:
+            ValueError: If the column is not in the header
+        """
+        if self._column_index is None:
+            self._column_index = {}
+            for index, each_column in enumerate(self.header.strip().split(",")):
+                self._column_index.setdefault(each_column, index)
+        if column not in self._column_index:
+            raise ValueError("{} is not in the header".format(column))
+        return self._column_index[column]
+
+
+class ReplacementFileCache(object):
+    """
+    Process-wide cache of the parsed replacement files.
+
+    A file is parsed once and reused until its modification time or size
+    changes. The least recently used files are evicted when the total size
+    exceeds max_size. Files which can not be stat'ed are read without caching.
+
+    Args:
+        max_size (int): Maximum total size of the cached files in bytes
+    """
+
+    def __init__(self, max_size=MAX_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _read(file_path):
+        with open(file_path, "r") as file_obj:
+            return ReplacementFile(file_obj.read())
+
+    def get(self, file_path):
+        """
+        Returns the parsed replacement file.
+
+        Args:
+            file_path (str): Path of the replacement file
+
+        Raises:
+            IOError: If the file can not be read
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return self._read(file_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry and entry[0] == version:
+                self._entries.move_to_end(file_path)
+                return entry[1]
+        replacement_file = self._read(file_path)
+        LOGGER.debug("Caching the replacement file {}".format(file_path))
+        with self._lock:
+            self._remove(file_path)
+            if stat.st_size <= self.max_size:
+                self._entries[file_path] = (version, replacement_file)
+                self._size += stat.st_size
+                while self._size > self.max_size:
+                    self._remove(next(iter(self._entries)))
+        return replacement_file
+
+    def _remove(self, file_path):
+        entry = self._entries.pop(file_path, None)
+        if entry:
+            self._size -= entry[0][1]
+
+    def clear(self):
+        """
+        Removes all the cached files.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+REPLACEMENT_FILE_CACHE = ReplacementFileCache()
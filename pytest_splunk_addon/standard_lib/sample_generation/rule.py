@@ -18,31 +18,34 @@ Provides Rules for all possible replacements for tokens.
 """
 import re
 import string
-import uuid
 
 from collections import namedtuple
 from datetime import datetime, timezone
-from faker import Faker
-from random import uniform, randint, choice
+from itertools import islice
+from random import randint, choice
 from time import mktime
 from .time_parser import time_parse
 import os
 import random
 
 from . import SampleEvent
+from .value_counter import DEFAULT_VALUE_COUNTER
+from .replacement_file_cache import REPLACEMENT_FILE_CACHE
+from .random_values import (
+    FAKER_POOL,
+    random_ipv4,
+    random_ipv6,
+    random_mac,
+    random_guid,
+    random_hex,
+    random_int,
+    random_float,
+)
 import logging
 import warnings
 
 LOGGER = logging.getLogger("pytest-splunk-addon")
 
-user_email_count = 0
-# user_email_count to generate unique values for
-# ["name", "email", "domain_user", "distinquised_name"] in each token
-
-event_host_count = 0
-# event_host_count is used to generate unique host for each event in
-# case of replacementType = all
-
 
 def raise_warning(warning_string):
     """
@@ -63,24 +66,34 @@ class Rule:
         token (dict): Dictionary containing token and its data
         psa_data_params (dict): PSA data stanzas dictionary
         sample_path (str): Path to the samples directory
+        value_counter (ValueCounter): Counter for the unique values of the rule
     """
 
     user_header = ["name", "email", "domain_user", "distinquised_name"]
     src_header = ["host", "ipv4", "ipv6", "fqdn"]
     token_value = namedtuple("token_value", ["key", "value"])
 
-    def __init__(self, token, psa_data_params=None, sample_path=None):
+    def __init__(
+        self, token, psa_data_params=None, sample_path=None, value_counter=None
+    ):
         self.token = token["token"]
         self.replacement = token["replacement"]
         self.replacement_type = token["replacementType"]
         self.field = token.get("field", self.token.strip("#"))
         self.psa_data_params = psa_data_params
         self.sample_path = sample_path
-        self.fake = Faker()
         self.file_count = 0
+        self.value_counter = value_counter or DEFAULT_VALUE_COUNTER
+
+    @property
+    def fake(self):
+        """
+        Faker instance shared by all the rules of the process
+        """
+        return FAKER_POOL.get()
 
     @classmethod
-    def parse_rule(cls, token, psa_data_params, sample_path):
+    def parse_rule(cls, token, psa_data_params, sample_path, value_counter=None):
         """
         Returns appropriate Rule object as per replacement type of token.
 
@@ -88,6 +101,7 @@ class Rule:
             token (dict): Dictionary containing token and its data
             psa_data_params (dict): PSA data stanzas dictionary
             sample_path (str): Path to the samples directory
+            value_counter (ValueCounter): Counter for the unique values of the rules
         """
         rule_book = {
             "integer": IntRule,
@@ -132,9 +146,9 @@ class Rule:
         replacement_type = token["replacementType"]
         replacement = token["replacement"]
         if replacement_type == "static":
-            return StaticRule(token)
+            return StaticRule(token, value_counter=value_counter)
         elif replacement_type == "timestamp":
-            return TimeRule(token, psa_data_params)
+            return TimeRule(token, psa_data_params, value_counter=value_counter)
         elif replacement_type == "random" or replacement_type == "all":
             for each_rule in rule_book:
                 if replacement.lower().startswith(each_rule):
@@ -152,9 +166,11 @@ class Rule:
                                 )
                             )
                         )
-                    return rule_book[each_rule](token, sample_path=sample_path)
+                    return rule_book[each_rule](
+                        token, sample_path=sample_path, value_counter=value_counter
+                    )
         elif replacement_type == "file" or replacement_type == "mvfile":
-            return FileRule(token, sample_path=sample_path)
+            return FileRule(token, sample_path=sample_path, value_counter=value_counter)
 
     def apply(self, events):
         """
@@ -166,9 +182,21 @@ class Rule:
             events (list): List of events(SampleEvent)
         """
         new_events = []
-        for each_event in events:
-            token_count = each_event.get_token_count(self.token)
-            token_values = list(self.replace(each_event, token_count))
+        token_counts = [each_event.get_token_count(self.token) for each_event in events]
+        # Random values of the whole stanza are generated at once if the rule supports it
+        values = None
+        if self.replacement_type == "random":
+            values = self.get_values(sum(token_counts))
+        if values is not None:
+            values = iter(values)
+        for each_event, token_count in zip(events, token_counts):
+            if values is not None:
+                token_values = [
+                    self.token_value(*([each_value] * 2))
+                    for each_value in islice(values, token_count)
+                ]
+            else:
+                token_values = list(self.replace(each_event, token_count))
             if token_count > 0:
                 if self.replacement_type == "all":
                     # NOTE: If replacement_type is all and same token is more than
@@ -176,8 +204,7 @@ class Rule:
                     #       value in that event
                     for each_token_value in token_values:
                         new_event = SampleEvent.copy(each_event)
-                        global event_host_count
-                        event_host_count += 1
+                        event_host_count = self.value_counter.next_value("event_host")
                         new_event.metadata["host"] = "{}-{}".format(
                             each_event.sample_name.replace("_", "-").replace(".", "-"),
                             event_host_count,
@@ -202,6 +229,17 @@ class Rule:
                 new_events.append(each_event)
         return new_events
 
+    def get_values(self, count):
+        """
+        Returns count random values generated at once or None if the rule
+        does not support the batched generation, in which case the values
+        are generated by replace for each event.
+
+        Args:
+            count (int): No. of values
+        """
+        return None
+
     def get_lookup_value(self, sample, key, headers, value_list):
         """
         Common method to read csv and get a random row.
@@ -217,8 +255,7 @@ class Rule:
             csv_row (list): list of replacement values for the rule.
         """
         csv_row = []
-        global user_email_count
-        user_email_count += 1
+        user_email_count = self.value_counter.next_value("user_email")
         name = "user{}".format(user_email_count)
         email = "user{}@email.com".format(user_email_count)
         domain_user = r"sample_domain.com\user{}".format(user_email_count)
@@ -259,8 +296,10 @@ class Rule:
 
     @staticmethod
     def clean_rules():
-        global event_host_count
-        event_host_count = 0
+        """
+        Restarts the counts of the rules created without a value counter.
+        """
+        DEFAULT_VALUE_COUNTER.reset()
 
 
 class IntRule(Rule):
@@ -280,10 +319,8 @@ class IntRule(Rule):
         if limits_match:
             lower_limit, upper_limit = limits_match.groups()
             if self.replacement_type == "random":
-                for _ in range(token_count):
-                    yield self.token_value(
-                        *([randint(int(lower_limit), int(upper_limit))] * 2)
-                    )
+                for each_int in self.get_values(token_count):
+                    yield self.token_value(*([each_int] * 2))
             else:
                 for each_int in range(int(lower_limit), int(upper_limit)):
                     yield self.token_value(*([str(each_int)] * 2))
@@ -294,6 +331,18 @@ class IntRule(Rule):
                 )
             )
 
+    def get_values(self, count):
+        """
+        Returns count random ints between the range mentioned in token.
+
+        Args:
+            count (int): No. of values
+        """
+        limits_match = re.match(r"[Ii]nteger\[(-?\d+):(-?\d+)\]", self.replacement)
+        if limits_match:
+            lower_limit, upper_limit = limits_match.groups()
+            return random_int(int(lower_limit), int(upper_limit), count)
+
 
 class FloatRule(Rule):
     """
@@ -308,30 +357,37 @@ class FloatRule(Rule):
             sample (SampleEvent): Instance containing event info
             token_count (int): No. of token in sample event where rule is applicable
         """
+        float_values = self.get_values(token_count)
+        if float_values is not None:
+            for each_float in float_values:
+                yield self.token_value(*([each_float] * 2))
+        else:
+            raise_warning(
+                "Non-supported format: '{}' in stanza '{}'.\n i.e float[0.00:70.00]".format(
+                    self.replacement, sample.sample_name
+                )
+            )
+
+    def get_values(self, count):
+        """
+        Returns count random floats between the range mentioned in token,
+        rounded to its precision.
+
+        Args:
+            count (int): No. of values
+        """
         float_match = re.match(r"[Ff]loat\[(-?[\d\.]+):(-?[\d\.]+)\]", self.replacement)
         if float_match:
             lower_limit, upper_limit = float_match.groups()
             precision = re.search("\[-?\d+\.?(\d*):", self.replacement).group(1)
             if not precision:
                 precision = str(1)
-            for _ in range(token_count):
-                yield self.token_value(
-                    *(
-                        [
-                            round(
-                                uniform(float(lower_limit), float(upper_limit)),
-                                len(precision),
-                            )
-                        ]
-                        * 2
-                    )
-                )
-        else:
-            raise_warning(
-                "Non-supported format: '{}' in stanza '{}'.\n i.e float[0.00:70.00]".format(
-                    self.replacement, sample.sample_name
+            return [
+                round(each_float, len(precision))
+                for each_float in random_float(
+                    float(lower_limit), float(upper_limit), count
                 )
-            )
+            ]
 
 
 class ListRule(Rule):
@@ -416,18 +472,13 @@ class FileRule(Rule):
 
         else:
             try:
-                with open(relative_file_path) as f:
-                    txt = f.read()
-                    lines = [each.strip() for each in txt.split("\n") if each]
-                    if (
-                        self.replacement_type == "random"
-                        or self.replacement_type == "file"
-                    ):
-                        for _ in range(token_count):
-                            yield self.token_value(*([choice(lines)] * 2))
-                    elif self.replacement_type == "all":
-                        for each_value in lines:
-                            yield self.token_value(*([each_value] * 2))
+                lines = REPLACEMENT_FILE_CACHE.get(relative_file_path).lines
+                if self.replacement_type == "random" or self.replacement_type == "file":
+                    for _ in range(token_count):
+                        yield self.token_value(*([choice(lines)] * 2))
+                elif self.replacement_type == "all":
+                    for each_value in lines:
+                        yield self.token_value(*([each_value] * 2))
             except IOError:
                 LOGGER.warning("File not found : {}".format(relative_file_path))
 
@@ -486,56 +537,51 @@ class FileRule(Rule):
             index (int): index value mentioned in file_path i.e. <file_path>:<index>
             token_count (int): No. of token in sample event where rule is applicable
         """
-        all_data = []
         try:
-            with open(file_path, "r") as _file:
-                selected_sample_lines = _file.readlines()
-                for i in selected_sample_lines:
-                    if i.strip() != "":
-                        all_data.append(i.strip())
+            replacement_file = REPLACEMENT_FILE_CACHE.get(file_path)
+            all_data = replacement_file.data
 
-                if (
-                    hasattr(sample, "replacement_map")
-                    and file_path in sample.replacement_map
-                ):
-                    index = int(index)
-                    file_values = sample.replacement_map[file_path]["data"][
-                        self.file_count
-                    ].split(",")
-                    if sample.replacement_map[file_path].get("find_all"):
-                        # if condition to increase the line no. of sample data
-                        # when the replacement_type = all provided in token for indexed file
-                        if self.file_count == len(all_data) - 1:
-                            # reset the file count when count reaches to pick value corresponding to
-                            # length of the sample data
-                            self.file_count = 0
-                        else:
-                            self.file_count += 1
-                    for _ in range(token_count):
+            if (
+                hasattr(sample, "replacement_map")
+                and file_path in sample.replacement_map
+            ):
+                index = int(index)
+                file_values = sample.replacement_map[file_path]["data"][
+                    self.file_count
+                ].split(",")
+                if sample.replacement_map[file_path].get("find_all"):
+                    # if condition to increase the line no. of sample data
+                    # when the replacement_type = all provided in token for indexed file
+                    if self.file_count == len(all_data) - 1:
+                        # reset the file count when count reaches to pick value corresponding to
+                        # length of the sample data
+                        self.file_count = 0
+                    else:
+                        self.file_count += 1
+                for _ in range(token_count):
+                    yield file_values[index - 1]
+            else:
+                if self.replacement_type == "all":
+                    sample.__setattr__(
+                        "replacement_map",
+                        {file_path: {"data": all_data, "find_all": True}},
+                    )
+                    for file_values in replacement_file.rows:
                         yield file_values[index - 1]
                 else:
-                    if self.replacement_type == "all":
+                    random_line = random.randint(0, len(all_data) - 1)
+                    if hasattr(sample, "replacement_map"):
+                        sample.replacement_map.update(
+                            {file_path: {"data": [all_data[random_line]]}}
+                        )
+                    else:
                         sample.__setattr__(
                             "replacement_map",
-                            {file_path: {"data": all_data, "find_all": True}},
+                            {file_path: {"data": [all_data[random_line]]}},
                         )
-                        for i in all_data:
-                            file_values = i.split(",")
-                            yield file_values[index - 1]
-                    else:
-                        random_line = random.randint(0, len(all_data) - 1)
-                        if hasattr(sample, "replacement_map"):
-                            sample.replacement_map.update(
-                                {file_path: {"data": [all_data[random_line]]}}
-                            )
-                        else:
-                            sample.__setattr__(
-                                "replacement_map",
-                                {file_path: {"data": [all_data[random_line]]}},
-                            )
-                        file_values = all_data[random_line].split(",")
-                        for _ in range(token_count):
-                            yield file_values[index - 1]
+                    file_values = replacement_file.rows[random_line]
+                    for _ in range(token_count):
+                        yield file_values[index - 1]
         except IndexError:
             LOGGER.error(
                 f"Index for column {index} in replacement"
@@ -554,14 +600,10 @@ class FileRule(Rule):
             index (int): index value mentioned in file_path i.e. <file_path>:<index>
             token_count (int): No. of token in sample event where rule is applicable
         """
-        all_data = []
-        header = ""
         try:
-            with open(file_path, "r") as _file:
-                header = next(_file)
-                for line in _file:
-                    if line.strip() != "":
-                        all_data.append(line.strip())
+            replacement_file = REPLACEMENT_FILE_CACHE.get(file_path)
+            header = replacement_file.header
+            all_data = replacement_file.lookup_data
             for _ in range(token_count):
                 if (
                     hasattr(sample, "replacement_map")
@@ -592,8 +634,8 @@ class FileRule(Rule):
                                 "replacement_map",
                                 {file_path: [header, all_data[self.file_count]]},
                             )
-                            index = header.strip().split(",").index(index)
-                            file_values = all_data[self.file_count].split(",")
+                            index = replacement_file.get_column_index(index)
+                            file_values = replacement_file.lookup_rows[self.file_count]
                             for _ in range(token_count):
                                 yield file_values[index]
                         else:
@@ -717,8 +759,17 @@ class Ipv4Rule(Rule):
             sample (SampleEvent): Instance containing event info
             token_count (int): No. of token in sample event where rule is applicable
         """
-        for _ in range(token_count):
-            yield self.token_value(*([self.fake.ipv4()] * 2))
+        for each_value in self.get_values(token_count):
+            yield self.token_value(*([each_value] * 2))
+
+    def get_values(self, count):
+        """
+        Returns count random ipv4 addresses.
+
+        Args:
+            count (int): No. of values
+        """
+        return random_ipv4(count)
 
 
 class Ipv6Rule(Rule):
@@ -734,8 +785,17 @@ class Ipv6Rule(Rule):
             sample (SampleEvent): Instance containing event info
             token_count (int): No. of token in sample event where rule is applicable
         """
-        for _ in range(token_count):
-            yield self.token_value(*([self.fake.ipv6()] * 2))
+        for each_value in self.get_values(token_count):
+            yield self.token_value(*([each_value] * 2))
+
+    def get_values(self, count):
+        """
+        Returns count random ipv6 addresses.
+
+        Args:
+            count (int): No. of values
+        """
+        return random_ipv6(count)
 
 
 class MacRule(Rule):
@@ -751,8 +811,17 @@ class MacRule(Rule):
             sample (SampleEvent): Instance containing event info
             token_count (int): No. of token in sample event where rule is applicable
         """
-        for _ in range(token_count):
-            yield self.token_value(*([self.fake.mac_address()] * 2))
+        for each_value in self.get_values(token_count):
+            yield self.token_value(*([each_value] * 2))
+
+    def get_values(self, count):
+        """
+        Returns count random mac addresses.
+
+        Args:
+            count (int): No. of values
+        """
+        return random_mac(count)
 
 
 class GuidRule(Rule):
@@ -768,8 +837,17 @@ class GuidRule(Rule):
             sample (SampleEvent): Instance containing event info
             token_count (int): No. of token in sample event where rule is applicable
         """
-        for _ in range(token_count):
-            yield self.token_value(*([str(uuid.uuid4())] * 2))
+        for guid in self.get_values(token_count):
+            yield self.token_value(*([guid] * 2))
+
+    def get_values(self, count):
+        """
+        Returns count random guids.
+
+        Args:
+            count (int): No. of values
+        """
+        return random_guid(count)
 
 
 class UserRule(Rule):
@@ -1181,29 +1259,10 @@ class HexRule(Rule):
         if hex_match:
             hex_range = hex_match.group(1)
             if hex_range.isnumeric():
-                hex_digits = [
-                    "0",
-                    "1",
-                    "2",
-                    "3",
-                    "4",
-                    "5",
-                    "6",
-                    "7",
-                    "8",
-                    "9",
-                    "a",
-                    "b",
-                    "c",
-                    "d",
-                    "e",
-                    "f",
-                ]
-                hex_array = []
-                for _ in range(token_count):
-                    for i in range(int(hex_range)):
-                        hex_array.append(hex_digits[randint(0, 15)])
-                    hex_value = "".join(hex_array)
+                # Each value extends the previous one by hex_range digits
+                hex_digits = random_hex(int(hex_range) * token_count)
+                for index in range(1, token_count + 1):
+                    hex_value = hex_digits[: int(hex_range) * index]
                     yield self.token_value(*([hex_value] * 2))
             else:
                 raise_warning(
@@ -16,17 +16,12 @@
 import re
 import logging
 from ..index_tests import key_fields
-from faker import Faker
+from .token_matcher import TokenMatcher
+from .value_counter import DEFAULT_VALUE_COUNTER
+from .random_values import FAKER_POOL
 from copy import deepcopy
 
 LOGGER = logging.getLogger("pytest-splunk-addon")
-host_ipv4, dvc_ipv4 = 51, 0
-src_ipv4, dest_ipv4 = 0, 0
-host_ipv6, dvc_ipv6 = 0, 0
-src_ipv6, dest_ipv6 = 0, 0
-host_count, fqdn_count = 0, 0
-url_ip_count = 0
-host_ipv4_octet_count, dvc_ipv4_octet_count = -1, 0
 
 ip_rules = {
     "src": {
@@ -59,15 +54,19 @@ class SampleEvent(object):
         event_string (str): Event content
         metadata (dict): Contains metadata for the event
         sample_name (str): Name of the file containing this event
+        value_counter (ValueCounter): Counter for the unique key field values
     """
 
-    def __init__(self, event_string, metadata, sample_name):
+    def __init__(self, event_string, metadata, sample_name, value_counter=None):
         self.event = event_string
         self.key_fields = dict()
         self.time_values = list()
         self.metadata = metadata
         self.sample_name = sample_name
         self.host_count = 0
+        self.token_spans = None
+        self.replacements = None
+        self.value_counter = value_counter or DEFAULT_VALUE_COUNTER
 
     def update(self, new_event):
         """
@@ -78,13 +77,35 @@ class SampleEvent(object):
         """
         LOGGER.debug("Updated the event {} with {}".format(self.event, new_event))
         self.event = new_event
+        self.token_spans = None
+        self.replacements = None
+
+    def scan_tokens(self, token_matcher):
+        """
+        Locates all the tokens of the event in a single scan.
+        Replacements made after the scan are collected and applied
+        together by apply_replacements.
+
+        Args:
+            token_matcher (TokenMatcher): Matcher compiled for the tokens of the stanza
+        """
+        self.token_spans = token_matcher.scan(self.event)
+        self.replacements = []
+
+    def apply_replacements(self):
+        """
+        Builds the event content from the replacements collected since scan_tokens.
+        """
+        if self.token_spans is not None:
+            self.event = TokenMatcher.substitute(self.event, self.replacements)
+            self.token_spans = None
+            self.replacements = None
 
     def get_host(self):
         """
         Returns a unique host value
         """
-        global host_count
-        host_count += 1
+        host_count = self.value_counter.next_value("host")
         LOGGER.debug(
             "Creating host value: {}-{}-{}".format(
                 "host", self.sample_name, str(host_count)
@@ -99,8 +120,7 @@ class SampleEvent(object):
         Args:
             rule (str): Type of rule either src, host, dest, dvc
         """
-        global host_count
-        host_count += 1
+        host_count = self.value_counter.next_value("host")
         LOGGER.debug(
             "Creating field with value: {}-{}{}".format(rule, "sample_host", host_count)
         )
@@ -113,8 +133,7 @@ class SampleEvent(object):
         Args:
             rule (str): Type of rule either src, host, dest, dvc
         """
-        global fqdn_count
-        fqdn_count += 1
+        fqdn_count = self.value_counter.next_value("fqdn")
         LOGGER.debug(
             "Creating fgdn field with value: {}_{}.{}{}.com".format(
                 rule, "sample_host", "sample_domain", fqdn_count
@@ -130,105 +149,28 @@ class SampleEvent(object):
             rule (str): Type of rule either src, host, dest, dvc.
             If the value is not one of the key field it will return a randomly generated Ipv4 address.
         """
-        if rule == "src":
-            global src_ipv4
-            src_ipv4 += 1
-            addr = [int(src_ipv4 / 256) % 256, src_ipv4 % 256]
-            LOGGER.debug(
-                "Creating ipv4 field with value: {}".format(
-                    "".join(
-                        [ip_rules.get(rule)["ipv4"], str(addr[0]), ".", str(addr[1])]
-                    )
-                )
-            )
-            return "".join(
-                [ip_rules.get(rule)["ipv4"], str(addr[0]), ".", str(addr[1])]
-            )
+        if rule in ("src", "dest", "url"):
+            ip_count = self.value_counter.next_value("{}_ipv4".format(rule))
+            prefix = ip_rules.get(rule)["ip_host" if rule == "url" else "ipv4"]
+            addr = [ip_count // 256 % 256, ip_count % 256]
         elif rule == "host":
-            global host_ipv4, host_ipv4_octet_count
-            host_ipv4_octet_count += 1
-            if host_ipv4_octet_count > 255:
-                host_ipv4 += 1
-                host_ipv4_octet_count = host_ipv4_octet_count % 256
-            if host_ipv4 == 101:
-                host_ipv4 = 51
-            LOGGER.debug(
-                "Creating ipv4 field with value: {}".format(
-                    "".join(
-                        [
-                            ip_rules.get(rule)["ipv4"],
-                            str(host_ipv4 % 101),
-                            ".",
-                            str(host_ipv4_octet_count % 256),
-                        ]
-                    )
-                )
-            )
-            return "".join(
-                [
-                    ip_rules.get(rule)["ipv4"],
-                    str(host_ipv4 % 101),
-                    ".",
-                    str(host_ipv4_octet_count % 256),
-                ]
-            )
+            # host addresses cycle through 172.16.51.0 - 172.16.100.255
+            ip_count = self.value_counter.next_value("host_ipv4") - 1
+            prefix = ip_rules.get(rule)["ipv4"]
+            addr = [51 + ip_count // 256 % 50, ip_count % 256]
         elif rule == "dvc":
-            global dvc_ipv4, dvc_ipv4_octet_count
-            dvc_ipv4 += 1
-            dvc_ipv4_octet_count += 1
-            LOGGER.debug(
-                "Creating ipv4 field with value: {}".format(
-                    "".join(
-                        [
-                            ip_rules.get(rule)["ipv4"],
-                            str(dvc_ipv4 % 51),
-                            ".",
-                            str(dvc_ipv4_octet_count % 256),
-                        ]
-                    )
-                )
-            )
-            return "".join(
-                [
-                    ip_rules.get(rule)["ipv4"],
-                    str(dvc_ipv4 % 51),
-                    ".",
-                    str(dvc_ipv4_octet_count % 256),
-                ]
-            )
-        elif rule == "dest":
-            global dest_ipv4
-            dest_ipv4 += 1
-            addr = [int(dest_ipv4 / 256) % 256, dest_ipv4 % 256]
-            LOGGER.debug(
-                "Creating ipv4 field with value: {}".format(
-                    "".join(
-                        [ip_rules.get(rule)["ipv4"], str(addr[0]), ".", str(addr[1])]
-                    )
-                )
-            )
-            return "".join(
-                [ip_rules.get(rule)["ipv4"], str(addr[0]), ".", str(addr[1])]
-            )
-        elif rule == "url":
-            global url_ip_count
-            url_ip_count += 1
-            addr = [int(url_ip_count / 256) % 256, url_ip_count % 256]
-            LOGGER.debug(
-                "Creating ipv4 field with value: {}".format(
-                    "".join(
-                        [ip_rules.get(rule)["ip_host"], str(addr[0]), ".", str(addr[1])]
-                    )
-                )
-            )
-            return "".join(
-                [ip_rules.get(rule)["ip_host"], str(addr[0]), ".", str(addr[1])]
-            )
+            ip_count = self.value_counter.next_value("dvc_ipv4")
+            prefix = ip_rules.get(rule)["ipv4"]
+            addr = [ip_count % 51, ip_count % 256]
         else:
-            temp_ipv4 = Faker().ipv4()
+            temp_ipv4 = FAKER_POOL.get().ipv4()
             LOGGER.debug("Creating ipv4 field with value: {}".format(temp_ipv4))
             return temp_ipv4
 
+        ipv4 = "".join([prefix, str(addr[0]), ".", str(addr[1])])
+        LOGGER.debug("Creating ipv4 field with value: {}".format(ipv4))
+        return ipv4
+
     def get_ipv6(self, rule):
         """
         Returns Ipv6 Address as per the rule.
@@ -237,24 +179,12 @@ class SampleEvent(object):
             rule (str): Type of rule either src, host, dest, dvc.
             If the value is not one of the key field it will return a randomly generated Ipv6 address.
         """
-        if rule == "src":
-            global src_ipv6
-            ipv6 = src_ipv6 % (int("ffffffffffffffff", 16))
-            src_ipv6 += 1
-        elif rule == "host":
-            global host_ipv6
-            ipv6 = host_ipv6 % (int("ffffffffffffffff", 16))
-            host_ipv6 += 1
-        elif rule == "dvc":
-            global dvc_ipv6
-            ipv6 = dvc_ipv6 % (int("ffffffffffffffff", 16))
-            dvc_ipv6 += 1
-        elif rule == "dest":
-            global dest_ipv6
-            ipv6 = dest_ipv6 % (int("ffffffffffffffff", 16))
-            dest_ipv6 += 1
+        if rule in ("src", "host", "dvc", "dest"):
+            ipv6 = (self.value_counter.next_value("{}_ipv6".format(rule)) - 1) % (
+                int("ffffffffffffffff", 16)
+            )
         else:
-            temp_ipv4 = Faker().ipv6()
+            temp_ipv4 = FAKER_POOL.get().ipv6()
             LOGGER.debug("Creating ipv6 field with value: {}".format(temp_ipv4))
             return temp_ipv4
 
@@ -279,16 +209,35 @@ class SampleEvent(object):
         Args:
             token (str): Token name
         """
+        if self.token_spans is not None and token in self.token_spans:
+            return len(self.token_spans[token])
         return len(re.findall(token, self.event, flags=re.MULTILINE))
 
     def replace_token(self, token, token_values):
         """
-        Replaces the token value in event
+        Replaces the token value in event.
+        If the tokens of the event are already scanned, the replacement is
+        collected and applied later by apply_replacements.
 
         Args:
             token (str): Token name
             token_values (list/str): Value(s) to be replaced in the token
         """
+        if self.token_spans is not None and token in self.token_spans:
+            spans = self.token_spans[token]
+            if isinstance(token_values, list):
+                self.replacements.extend(
+                    (start, end, token_value.value)
+                    for (start, end), token_value in zip(spans, token_values)
+                )
+            else:
+                self.replacements.extend(
+                    (start, end, token_values) for start, end in spans
+                )
+            # The spans are shared with the copies of the event
+            self.token_spans = {**self.token_spans, token: []}
+            return
+        self.apply_replacements()
         # TODO: How to handle dependent Values with list of token_values
         if isinstance(token_values, list):
             sample_tokens = re.finditer(token, self.event, flags=re.MULTILINE)
@@ -355,6 +304,8 @@ class SampleEvent(object):
         new_event.key_fields = event.key_fields.copy()
         new_event.time_values = event.time_values[:]
         new_event.metadata = deepcopy(event.metadata)
+        if getattr(event, "replacements", None) is not None:
+            new_event.replacements = event.replacements[:]
         return new_event
 
     def update_metadata(self, event, metadata, key_fields):
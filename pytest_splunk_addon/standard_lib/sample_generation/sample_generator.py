@@ -13,11 +13,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 from . import PytestSplunkAddonDataParser
 from . import SampleStanza
+from .value_counter import ValueCounter
 from itertools import cycle
+import logging
+
+LOGGER = logging.getLogger("pytest-splunk-addon")
+
+
+def tokenize_sample_stanzas(
+    sample_stanzas, conf_name, value_counter, shard, shard_count
+):
+    """
+    Tokenizes the sample stanzas of a shard and returns them.
+    Used as the task of the worker processes, the tokenized stanzas
+    are sent back to the main process.
+
+    The stanzas and the value counter are pickled together, so all the
+    stanzas of the shard share the same counter in the worker process.
+
+    Args:
+        sample_stanzas (list): Stanzas of the shard to tokenize
+        conf_name (str): Name of the conf file, "psa-data-gen"
+        value_counter (ValueCounter): Counter shared by the stanzas
+        shard (int): Index of the shard
+        shard_count (int): Total number of shards
+    """
+    value_counter.set_shard(shard, shard_count)
+    value_counter.seed_random()
+    for each_stanza in sample_stanzas:
+        each_stanza.tokenize(conf_name)
+    return sample_stanzas
 
 
 class SampleGenerator(object):
@@ -29,17 +58,26 @@ class SampleGenerator(object):
     sample_stanzas = []
     conf_name = " "
 
-    def __init__(self, addon_path, config_path=None, process_count=4):
+    def __init__(
+        self, addon_path, config_path=None, process_count=4, seed=None, cache=None
+    ):
         """
         init method for the class
 
         Args:
             addon_path(str): path to the addon
-            process_count(no): generate {no} process for execution
+            process_count(no): generate {no} process for execution.
+                The stanzas are tokenized in the main process if it is 1 or less.
+            seed(int): seed for the random values of the events.
+                Same seed and process_count generate the same events.
+            cache(TokenizedEventCache): cache to reuse the stanzas tokenized
+                in the previous runs, the stanzas are always tokenized if None.
         """
         self.addon_path = addon_path
         self.process_count = process_count
         self.config_path = config_path
+        self.seed = seed
+        self.cache = cache
 
     def get_samples(self):
         """
@@ -49,21 +87,120 @@ class SampleGenerator(object):
             psa_data_parser = PytestSplunkAddonDataParser(
                 self.addon_path, config_path=self.config_path
             )
-            sample_stanzas = psa_data_parser.get_sample_stanzas()
+            value_counter = ValueCounter(self.seed)
+            sample_stanzas = psa_data_parser.get_sample_stanzas(value_counter)
             SampleGenerator.conf_name = psa_data_parser.conf_name
-            with ThreadPoolExecutor(min(20, max(len(sample_stanzas), 1))) as t:
-                t.map(SampleStanza.get_raw_events, sample_stanzas)
-            _ = list(
-                map(
-                    SampleStanza.tokenize,
-                    sample_stanzas,
-                    cycle([SampleGenerator.conf_name]),
+            if self.cache:
+                SampleGenerator.sample_stanzas = self._tokenize_with_cache(
+                    sample_stanzas, value_counter
+                )
+            else:
+                SampleGenerator.sample_stanzas = self._tokenize(
+                    sample_stanzas, value_counter
                 )
-            )
-            SampleGenerator.sample_stanzas = sample_stanzas
         for each_sample in SampleGenerator.sample_stanzas:
             yield from each_sample.get_tokenized_events()
 
+    def _tokenize(self, sample_stanzas, value_counter):
+        """
+        Tokenizes the stanzas, in worker processes if process_count allows.
+
+        Args:
+            sample_stanzas (list): List of SampleStanza objects
+            value_counter (ValueCounter): Counter shared by the stanzas
+
+        Returns:
+            List of tokenized SampleStanza objects
+        """
+        if self.process_count > 1 and len(sample_stanzas) > 1:
+            return self._tokenize_in_processes(sample_stanzas, value_counter)
+        with ThreadPoolExecutor(min(20, max(len(sample_stanzas), 1))) as t:
+            t.map(SampleStanza.get_raw_events, sample_stanzas)
+        value_counter.seed_random()
+        _ = list(
+            map(
+                SampleStanza.tokenize,
+                sample_stanzas,
+                cycle([SampleGenerator.conf_name]),
+            )
+        )
+        return sample_stanzas
+
+    def _tokenize_with_cache(self, sample_stanzas, value_counter):
+        """
+        Reuses the cached stanzas whose inputs have not changed and
+        tokenizes only the remaining ones, which are then cached.
+
+        Args:
+            sample_stanzas (list): List of SampleStanza objects
+            value_counter (ValueCounter): Counter shared by the stanzas
+
+        Returns:
+            List of tokenized SampleStanza objects, in the order of sample_stanzas
+        """
+        keys = [
+            self.cache.get_key(each_stanza, self.seed) for each_stanza in sample_stanzas
+        ]
+        tokenized_stanzas = [
+            self.cache.load(each_stanza.sample_name, key)
+            for each_stanza, key in zip(sample_stanzas, keys)
+        ]
+        outdated = [
+            index
+            for index, each_stanza in enumerate(tokenized_stanzas)
+            if each_stanza is None
+        ]
+        LOGGER.info(
+            "Reusing %d cached stanzas, tokenizing %d stanzas",
+            len(sample_stanzas) - len(outdated),
+            len(outdated),
+        )
+        if outdated:
+            new_stanzas = self._tokenize(
+                [sample_stanzas[index] for index in outdated], value_counter
+            )
+            for index, each_stanza in zip(outdated, new_stanzas):
+                self.cache.store(keys[index], each_stanza)
+                tokenized_stanzas[index] = each_stanza
+        return tokenized_stanzas
+
+    def _tokenize_in_processes(self, sample_stanzas, value_counter):
+        """
+        Tokenizes the stanzas across worker processes.
+        The stanzas are split round robin into one shard per process, each
+        shard allocates its unique values from its own range of value_counter.
+        The tokenized stanzas are returned in the same order as sample_stanzas.
+
+        Args:
+            sample_stanzas (list): List of SampleStanza objects
+            value_counter (ValueCounter): Counter shared by the stanzas
+
+        Returns:
+            List of tokenized SampleStanza objects
+        """
+        shard_count = min(self.process_count, len(sample_stanzas))
+        LOGGER.info(
+            "Tokenizing %d stanzas with %d processes",
+            len(sample_stanzas),
+            shard_count,
+        )
+        shards = [sample_stanzas[shard::shard_count] for shard in range(shard_count)]
+        with ProcessPoolExecutor(shard_count) as executor:
+            tokenized_shards = list(
+                executor.map(
+                    tokenize_sample_stanzas,
+                    shards,
+                    cycle([SampleGenerator.conf_name]),
+                    cycle([value_counter]),
+                    range(shard_count),
+                    cycle([shard_count]),
+                )
+            )
+        tokenized_stanzas = [None] * len(sample_stanzas)
+        for shard, tokenized_shard in enumerate(tokenized_shards):
+            tokenized_stanzas[shard::shard_count] = tokenized_shard
+        return tokenized_stanzas
+
     @classmethod
     def clean_samples(cls):
         cls.sample_stanzas = list()
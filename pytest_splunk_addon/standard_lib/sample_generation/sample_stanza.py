@@ -19,6 +19,7 @@ import copy
 from . import Rule
 from . import raise_warning
 from . import SampleEvent
+from .token_matcher import TokenMatcher
 import logging
 
 LOGGER = logging.getLogger("pytest-splunk-addon")
@@ -41,13 +42,19 @@ class SampleStanza(object):
     Args:
         sample_path (str): Path to the sample file
         psa_data_params (dict): Dictionary representing pytest-splunk-addon-data.conf
+        value_counter (ValueCounter): Counter for the unique values of the rules and events
     """
 
-    def __init__(self, sample_path, psa_data_params):
+    def __init__(self, sample_path, psa_data_params, value_counter=None):
         self.sample_path = sample_path
+        self.value_counter = value_counter
         self.sample_name = os.path.basename(sample_path)
+        self.psa_data_params = psa_data_params
         self.metadata = self._parse_meta(psa_data_params)
         self.sample_rules = list(self._parse_rules(psa_data_params, self.sample_path))
+        self.token_matcher = TokenMatcher.compile(
+            [each_rule.token for each_rule in self.sample_rules]
+        )
         self.input_type = self.metadata.get("input_type", "default")
         self.host_count = 0
 
@@ -94,9 +101,15 @@ class SampleStanza(object):
             raw_event.insert(event_counter, list(self._get_raw_sample()))
             if not raw_event[-1]:
                 break
+            if self.token_matcher:
+                for each_event in raw_event[event_counter]:
+                    each_event.scan_tokens(self.token_matcher)
             for each_rule in self.sample_rules:
                 if each_rule:
                     raw_event[event_counter] = each_rule.apply(raw_event[event_counter])
+            if self.token_matcher:
+                for each_event in raw_event[event_counter]:
+                    each_event.apply_replacements()
             bulk_event.extend(raw_event[event_counter])
             event_counter = event_counter + 1
 
@@ -128,7 +141,9 @@ class SampleStanza(object):
             psa_data_params["tokens"]
         )
         for each_token, token_value in token_list:
-            applied_rule = Rule.parse_rule(token_value, psa_data_params, sample_path)
+            applied_rule = Rule.parse_rule(
+                token_value, psa_data_params, sample_path, self.value_counter
+            )
             if not applied_rule:
                 raise_warning(
                     "Unidentified Rule: '{}' for token '{}'".format(
@@ -274,12 +289,22 @@ class SampleStanza(object):
                 for each_event in self.break_events(sample_raw):
                     if each_event:
                         event_metadata = self.get_eventmetadata()
-                        yield SampleEvent(each_event, event_metadata, self.sample_name)
+                        yield SampleEvent(
+                            each_event,
+                            event_metadata,
+                            self.sample_name,
+                            value_counter=self.value_counter,
+                        )
             elif self.input_type in ["modinput", "windows_input"]:
                 for each_line in sample_raw.split("\n"):
                     if each_line:
                         event_metadata = self.get_eventmetadata()
-                        yield SampleEvent(each_line, event_metadata, self.sample_name)
+                        yield SampleEvent(
+                            each_line,
+                            event_metadata,
+                            self.sample_name,
+                            value_counter=self.value_counter,
+                        )
             elif self.input_type in [
                 "file_monitor",
                 "uf_file_monitor",
@@ -292,7 +317,12 @@ class SampleStanza(object):
                 if not event:
                     raise_warning("sample file: '{}' is empty".format(self.sample_path))
                 else:
-                    yield SampleEvent(event, self.metadata, self.sample_name)
+                    yield SampleEvent(
+                        event,
+                        self.metadata,
+                        self.sample_name,
+                        value_counter=self.value_counter,
+                    )
 
             if not self.input_type:
                 # TODO: input_type not found scenario
@@ -14,6 +14,8 @@
 # limitations under the License.
 #
 from . import SampleGenerator
+from .tokenized_event_cache import TokenizedEventCache
+from .event_store import EventStore
 import os
 import pickle
 from filelock import FileLock
@@ -21,13 +23,41 @@ import json
 import pytest
 
 
+class GeneratedEvents(object):
+    """
+    Tokenized events of a SampleGenerator, yielded again from its tokenized
+    stanzas on each iteration instead of being collected in a list.
+
+    Args:
+        sample_generator (SampleGenerator): Generator of the events
+    """
+
+    def __init__(self, sample_generator):
+        self.sample_generator = sample_generator
+
+    def __iter__(self):
+        return self.sample_generator.get_samples()
+
+
 class SampleXdistGenerator:
+    seed = None
+    cache_dir = None
+
     def __init__(self, addon_path, config_path=None, process_count=4):
         self.addon_path = addon_path
         self.process_count = process_count
         self.config_path = config_path
 
-    def get_samples(self, store_events):
+    def get_samples(self, store_events, stream=False):
+        """
+        Returns the conf_name and the tokenized events of the add-on.
+
+        Args:
+            store_events (bool): Store the tokenized events in .tokenized_events
+            stream (bool): Return the tokenized events as an iterable which yields
+                them one by one instead of a list. The events generated by the
+                xdist workers are always read lazily from the event store.
+        """
 
         if self.tokenized_event_source == "pregenerated":
             with open(self.event_path, "rb") as file_obj:
@@ -46,25 +76,39 @@ class SampleXdistGenerator:
         if "PYTEST_XDIST_WORKER" in os.environ:
             file_path = os.environ.get("PYTEST_XDIST_TESTRUNUID") + "_events"
             with FileLock(str(file_path) + ".lock"):
-                if os.path.exists(file_path):
-                    with open(file_path, "rb") as file_obj:
-                        store_sample = pickle.load(file_obj)
-                else:
+                if not os.path.exists(file_path):
                     sample_generator = SampleGenerator(
-                        self.addon_path, self.config_path
+                        self.addon_path,
+                        self.config_path,
+                        self.process_count,
+                        seed=self.seed,
+                        cache=self.get_cache(),
                     )
                     tokenized_events = list(sample_generator.get_samples())
-                    store_sample = {
-                        "conf_name": SampleGenerator.conf_name,
-                        "tokenized_events": tokenized_events,
-                    }
                     if store_events:
                         self.store_events(tokenized_events)
-                    with open(file_path, "wb") as file_obj:
-                        pickle.dump(store_sample, file_obj)
+                    EventStore.write(
+                        file_path, SampleGenerator.conf_name, tokenized_events
+                    )
+            # All the workers, including the one which generated the events,
+            # read the events from the store so they collect the same tests
+            event_store = EventStore(file_path)
+            store_sample = {
+                "conf_name": event_store.conf_name,
+                "tokenized_events": event_store,
+            }
         else:
-            sample_generator = SampleGenerator(self.addon_path, self.config_path)
-            tokenized_events = list(sample_generator.get_samples())
+            sample_generator = SampleGenerator(
+                self.addon_path,
+                self.config_path,
+                self.process_count,
+                seed=self.seed,
+                cache=self.get_cache(),
+            )
+            if stream:
+                tokenized_events = GeneratedEvents(sample_generator)
+            else:
+                tokenized_events = list(sample_generator.get_samples())
             store_sample = {
                 "conf_name": SampleGenerator.conf_name,
                 "tokenized_events": tokenized_events,
@@ -73,10 +117,23 @@ class SampleXdistGenerator:
                 self.store_events(tokenized_events)
         if self.tokenized_event_source == "store_new" and not self.event_stored:
             with open(self.event_path, "wb") as file_obj:
-                pickle.dump(store_sample, file_obj)
+                pickle.dump(
+                    {
+                        "conf_name": store_sample["conf_name"],
+                        "tokenized_events": list(store_sample["tokenized_events"]),
+                    },
+                    file_obj,
+                )
             self.event_stored = True
         return store_sample
 
+    def get_cache(self):
+        """
+        Returns the cache of the tokenized events or None if it is disabled.
+        """
+        if self.cache_dir:
+            return TokenizedEventCache(self.cache_dir)
+
     def store_events(self, tokenized_events):
         if not os.path.exists(os.path.join(os.getcwd(), ".tokenized_events")):
             os.makedirs(os.path.join(os.getcwd(), ".tokenized_events"))
@@ -0,0 +1,116 @@
+#
+# Copyright 2021 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+import logging
+
+LOGGER = logging.getLogger("pytest-splunk-addon")
+
+# Numbered or named back references can not be shifted into a combined pattern
+BACK_REFERENCE_REX = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class TokenMatcher(object):
+    """
+    Locates the tokens of a SampleStanza in a single scan of the event.
+
+    All the tokens are compiled into one alternation, each token wrapped in
+    its own group, so one pass over the event gives the spans of every token.
+    If a token contains groups, the span of its first group is the part which
+    gets replaced, same as SampleEvent.replace_token.
+
+    Args:
+        tokens (list): List of token regex strings in the order of the rules
+    """
+
+    def __init__(self, tokens):
+        self.tokens = list(dict.fromkeys(tokens))
+        group_index = 1
+        self._groups = []
+        alternatives = []
+        for token in self.tokens:
+            token_groups = re.compile(token, flags=re.MULTILINE).groups
+            self._groups.append((token, group_index, token_groups > 0))
+            alternatives.append("({})".format(token))
+            group_index += token_groups + 1
+        self.pattern = re.compile("|".join(alternatives), flags=re.MULTILINE)
+
+    @classmethod
+    def compile(cls, tokens):
+        """
+        Returns a TokenMatcher for the tokens or None if they can not be combined.
+
+        Args:
+            tokens (list): List of token regex strings
+        """
+        if not tokens or not all(isinstance(token, str) for token in tokens):
+            return None
+        if any(BACK_REFERENCE_REX.search(token) for token in tokens):
+            LOGGER.debug("Tokens contain back references, using per token search")
+            return None
+        try:
+            return cls(tokens)
+        except re.error as error:
+            LOGGER.debug(
+                "Tokens can not be combined: %s, using per token search", error
+            )
+            return None
+
+    def scan(self, event_string):
+        """
+        Returns the spans of all the tokens found in the event.
+
+        Args:
+            event_string (str): Event content
+
+        Returns:
+            dict: token => list of (start, end) spans, in order of appearance
+        """
+        token_spans = {token: [] for token in self.tokens}
+        for match_object in self.pattern.finditer(event_string):
+            for token, group_index, has_groups in self._groups:
+                if match_object.start(group_index) != -1:
+                    span = match_object.span(group_index)
+                    if has_groups and match_object.start(group_index + 1) != -1:
+                        span = match_object.span(group_index + 1)
+                    token_spans[token].append(span)
+                    break
+        return token_spans
+
+    @staticmethod
+    def substitute(event_string, replacements):
+        """
+        Builds the event with all the replacements applied using a single join.
+
+        Args:
+            event_string (str): Event content
+            replacements (list): List of (start, end, value) of the spans to replace
+
+        Returns:
+            str: Event content with the replaced values
+        """
+        if not replacements:
+            return event_string
+        segments = []
+        position = 0
+        for start, end, value in sorted(replacements, key=lambda x: x[0]):
+            if start < position:
+                # Span already covered by another token
+                continue
+            segments.append(event_string[position:start])
+            segments.append(str(value))
+            position = end
+        segments.append(event_string[position:])
+        return "".join(segments)
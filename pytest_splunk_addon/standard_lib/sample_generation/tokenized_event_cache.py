@@ -0,0 +1,127 @@
+#
+# Copyright 2021 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import json
+import pickle
+import hashlib
+import logging
+import tempfile
+
+from pytest_splunk_addon import __version__
+from .rule import FileRule
+
+LOGGER = logging.getLogger("pytest-splunk-addon")
+
+
+class TokenizedEventCache(object):
+    """
+    On-disk cache of the tokenized sample stanzas.
+
+    Each stanza is stored in its own file along with a key, the hash of
+    everything the tokenized events are generated from: the stanza of
+    pytest-splunk-addon-data.conf, the sample file, the replacement files
+    of the file rules, the seed and the plugin version. A stanza is reused
+    only if its key has not changed, so editing one sample file
+    regenerates only that stanza.
+
+    Args:
+        cache_dir (str): Directory to store the tokenized stanzas
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def get_key(self, sample_stanza, seed=None):
+        """
+        Returns the hash of the inputs of the sample stanza.
+
+        Args:
+            sample_stanza (SampleStanza): Parsed stanza, not yet tokenized
+            seed (int): Seed for the random values of the events
+        """
+        key = hashlib.sha256()
+        key.update(__version__.encode("utf-8"))
+        key.update(str(seed).encode("utf-8"))
+        key.update(
+            json.dumps(
+                sample_stanza.psa_data_params, sort_keys=True, default=str
+            ).encode("utf-8")
+        )
+        input_files = [sample_stanza.sample_path] + [
+            each_rule.get_file_path()[0]
+            for each_rule in sample_stanza.sample_rules
+            if isinstance(each_rule, FileRule)
+        ]
+        for each_file in input_files:
+            key.update(each_file.encode("utf-8"))
+            try:
+                with open(each_file, "rb") as file_obj:
+                    key.update(hashlib.sha256(file_obj.read()).digest())
+            except IOError:
+                key.update(b"\0")
+        return key.hexdigest()
+
+    def _get_path(self, sample_name):
+        return os.path.join(self.cache_dir, "{}.pickle".format(sample_name))
+
+    def load(self, sample_name, key):
+        """
+        Returns the cached tokenized stanza or None if the key has changed.
+
+        Args:
+            sample_name (str): Name of the sample file
+            key (str): Key of the stanza, see get_key
+        """
+        try:
+            with open(self._get_path(sample_name), "rb") as file_obj:
+                cached = pickle.load(file_obj)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            LOGGER.warning(
+                "Could not read the cached events of {}: {}".format(sample_name, e)
+            )
+            return None
+        if cached.get("key") != key:
+            LOGGER.info("Cached events of {} are outdated".format(sample_name))
+            return None
+        LOGGER.info("Using the cached events of {}".format(sample_name))
+        return cached.get("sample_stanza")
+
+    def store(self, key, sample_stanza):
+        """
+        Stores the tokenized stanza, replacing the previous one of the sample.
+
+        Args:
+            key (str): Key of the stanza, see get_key
+            sample_stanza (SampleStanza): Tokenized stanza
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Written to a temporary file first so a concurrent load never
+        # reads a partially written stanza
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file_obj:
+                pickle.dump({"key": key, "sample_stanza": sample_stanza}, file_obj)
+            os.replace(temp_path, self._get_path(sample_stanza.sample_name))
+        except Exception as e:
+            LOGGER.warning(
+                "Could not cache the events of {}: {}".format(
+                    sample_stanza.sample_name, e
+                )
+            )
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,85 @@
+#
+# Copyright 2021 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import random
+import logging
+from faker import Faker
+
+LOGGER = logging.getLogger("pytest-splunk-addon")
+
+
+class ValueCounter(object):
+    """
+    Allocates the unique values for the key fields (host, ip, fqdn, user etc.)
+    and seeds the random values of the rules.
+
+    Each shard gets a disjoint range of values: the k-th value of a counter
+    in shard i out of n shards is ``k * n + i + 1``. With a single shard the
+    values are 1, 2, 3...
+
+    Args:
+        seed (int): Seed for the random values. Random values are not seeded if None.
+        shard (int): Index of the shard
+        shard_count (int): Total number of shards
+    """
+
+    def __init__(self, seed=None, shard=0, shard_count=1):
+        self.seed = seed
+        self.shard = shard
+        self.shard_count = shard_count
+        self.counts = {}
+
+    def next_value(self, name):
+        """
+        Returns the next value of the counter, unique across the shards.
+
+        Args:
+            name (str): Name of the counter i.e. src_ipv4, host, fqdn
+        """
+        count = self.counts.get(name, 0)
+        self.counts[name] = count + 1
+        return count * self.shard_count + self.shard + 1
+
+    def set_shard(self, shard, shard_count):
+        """
+        Moves the counter to the given shard and restarts all the counts.
+
+        Args:
+            shard (int): Index of the shard
+            shard_count (int): Total number of shards
+        """
+        self.shard = shard
+        self.shard_count = shard_count
+        self.counts = {}
+
+    def seed_random(self):
+        """
+        Seeds the random module and Faker for the shard, if a seed is set.
+        """
+        if self.seed is not None:
+            shard_seed = "{}-{}".format(self.seed, self.shard)
+            LOGGER.info("Seeding the random values with %s", shard_seed)
+            random.seed(shard_seed)
+            Faker.seed(shard_seed)
+
+    def reset(self):
+        """
+        Restarts all the counts.
+        """
+        self.counts = {}
+
+
+# Used by the rules and events created without a counter
+DEFAULT_VALUE_COUNTER = ValueCounter()
@@ -157,3 +157,45 @@ def test_requirement_tests_can_be_run(
     requirement_mock.get_events.assert_called_once()
     assert get_ingestor_mock.ingest.call_count == 3
     get_ingestor_mock.ingest.assert_has_calls([call(requirement_events, 20)])
+
+
+def test_events_can_be_streamed(
+    ingestor_helper, sample_mock, file_monitor_events, modinput_events
+):
+    ingested = {}
+
+    def get_event_ingestor(input_type, ingest_meta_data):
+        event_ingestor = MagicMock()
+        event_ingestor.ingest.side_effect = (
+            lambda events, thread_count: ingested.setdefault(input_type, list(events))
+        )
+        return event_ingestor
+
+    with patch.object(
+        ingestor_helper, "get_event_ingestor", side_effect=get_event_ingestor
+    ):
+        ingestor_helper.ingest_events(
+            ingest_meta_data={},
+            addon_path="fake_path",
+            config_path="tests/unit/event_ingestors",
+            thread_count=20,
+            store_events=False,
+            run_requirement_test="None",
+            stream_events=True,
+        )
+    sample_mock.get_samples.assert_called_once_with(False, stream=True)
+    assert ingested == {
+        "file_monitor": file_monitor_events,
+        "modinput": modinput_events,
+    }
+    assert isinstance(file_monitor_events[0].event, bytes)
+
+
+def test_streamed_ingestion_error(ingestor_helper, tokenized_events):
+    event_ingestor = MagicMock()
+    event_ingestor.ingest.side_effect = ValueError("ingestion failed")
+    with patch.object(
+        ingestor_helper, "get_event_ingestor", return_value=event_ingestor
+    ):
+        with pytest.raises(ValueError, match="ingestion failed"):
+            ingestor_helper.stream_events(tokenized_events, {}, 20, queue_size=1)
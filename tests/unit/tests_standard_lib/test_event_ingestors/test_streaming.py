@@ -0,0 +1,101 @@
+import threading
+import pytest
+from unittest.mock import MagicMock
+
+from pytest_splunk_addon.standard_lib.event_ingestors.streaming import (
+    EventQueue,
+    batched,
+    bounded_map,
+)
+
+
+@pytest.mark.parametrize(
+    "items, expected",
+    [
+        (range(5), [[0, 1], [2, 3], [4]]),
+        (range(4), [[0, 1], [2, 3]]),
+        ([], []),
+    ],
+)
+def test_batched(items, expected):
+    assert list(batched(iter(items), 2)) == expected
+
+
+def test_bounded_map():
+    results = []
+    bounded_map(results.append, iter(range(50)), 1)
+    assert results == list(range(50))
+
+
+def test_bounded_map_consumes_lazily():
+    consumed = []
+    release = threading.Event()
+
+    def items():
+        for each in range(20):
+            consumed.append(each)
+            yield each
+
+    def func(item):
+        release.wait()
+
+    thread = threading.Thread(target=bounded_map, args=(func, items(), 2))
+    thread.start()
+    thread.join(0.2)
+    assert len(consumed) == 5
+    release.set()
+    thread.join()
+    assert len(consumed) == 20
+
+
+def test_bounded_map_error():
+    def func(item):
+        if item == 3:
+            raise ValueError("ingestion failed")
+
+    with pytest.raises(ValueError, match="ingestion failed"):
+        bounded_map(func, iter(range(10)), 2)
+
+
+class TestEventQueue:
+    def test_consume(self):
+        event_queue = EventQueue(2)
+        event_ingestor = MagicMock()
+        ingested = []
+        event_ingestor.ingest.side_effect = lambda events, thread_count: ingested.extend(
+            events
+        )
+        thread = threading.Thread(
+            target=event_queue.consume, args=(event_ingestor, 20)
+        )
+        thread.start()
+        for each in range(10):
+            event_queue.put(each)
+        event_queue.close()
+        thread.join()
+        assert ingested == list(range(10))
+        assert event_queue.error is None
+
+    def test_put_blocks_while_full(self):
+        event_queue = EventQueue(2)
+        event_queue.put(1)
+        event_queue.put(2)
+        thread = threading.Thread(target=event_queue.put, args=(3,))
+        thread.start()
+        thread.join(0.2)
+        assert thread.is_alive()
+        events = iter(event_queue)
+        assert next(events) == 1
+        thread.join()
+        event_queue.close()
+        assert list(events) == [2, 3]
+
+    def test_ingestor_error(self):
+        event_queue = EventQueue(1)
+        event_ingestor = MagicMock()
+        event_ingestor.ingest.side_effect = ValueError("ingestion failed")
+        event_queue.consume(event_ingestor, 20)
+        assert event_queue.consumed
+        with pytest.raises(ValueError, match="ingestion failed"):
+            event_queue.put("event")
+        event_queue.close()
@@ -0,0 +1,67 @@
+import pytest
+
+from pytest_splunk_addon.standard_lib.sample_generation import SampleEvent
+from pytest_splunk_addon.standard_lib.sample_generation.event_store import EventStore
+
+METADATA_1 = {"host": "host_1", "input_type": "modinput", "sample_count": 1}
+METADATA_2 = {"host": "host_2", "input_type": "default"}
+
+
+def sample_event(event, metadata, sample_name, key_fields=None, time_values=None):
+    each_event = SampleEvent(event, metadata, sample_name)
+    each_event.key_fields = key_fields or {}
+    each_event.time_values = time_values or []
+    return each_event
+
+
+@pytest.fixture
+def tokenized_events():
+    return [
+        sample_event("event 1", METADATA_1, "sample_1", {"src": ["10.1.0.1"]}),
+        sample_event("événement 2", METADATA_1, "sample_1", {"src": ["10.1.0.2"]}),
+        sample_event("event 3\nline 2", METADATA_2, "sample_2", {}, [1616782726.0]),
+    ]
+
+
+class TestEventStore:
+    def test_write_and_read(self, tmp_path, tokenized_events):
+        file_path = str(tmp_path / "events")
+        EventStore.write(file_path, "psa-data-gen", tokenized_events)
+        event_store = EventStore(file_path)
+        assert event_store.conf_name == "psa-data-gen"
+        assert len(event_store) == 3
+        for stored, expected in zip(event_store, tokenized_events):
+            assert stored.event == expected.event
+            assert stored.metadata == expected.metadata
+            assert stored.sample_name == expected.sample_name
+            assert stored.key_fields == expected.key_fields
+            assert stored.time_values == expected.time_values
+        assert event_store[-1].event == "event 3\nline 2"
+        assert event_store[0].metadata is event_store[1].metadata
+
+    def test_bytes_event(self, tmp_path):
+        file_path = str(tmp_path / "events")
+        EventStore.write(
+            file_path, "psa-data-gen", [sample_event(b"event", METADATA_2, "sample")]
+        )
+        assert EventStore(file_path)[0].event == "event"
+
+    def test_empty(self, tmp_path):
+        file_path = str(tmp_path / "events")
+        EventStore.write(file_path, "eventgen", [])
+        event_store = EventStore(file_path)
+        assert event_store.conf_name == "eventgen"
+        assert list(event_store) == []
+
+    @pytest.mark.parametrize("index", [3, -4])
+    def test_index_out_of_range(self, tmp_path, tokenized_events, index):
+        file_path = str(tmp_path / "events")
+        EventStore.write(file_path, "psa-data-gen", tokenized_events)
+        with pytest.raises(IndexError):
+            EventStore(file_path)[index]
+
+    def test_not_event_store(self, tmp_path):
+        file_path = tmp_path / "events"
+        file_path.write_bytes(b"not an event store")
+        with pytest.raises(ValueError, match="is not an event store"):
+            EventStore(str(file_path))
@@ -0,0 +1,110 @@
+import random
+import re
+from ipaddress import IPv4Address, IPv6Address
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+
+from pytest_splunk_addon.standard_lib.sample_generation.random_values import (
+    FakerPool,
+    random_chunks,
+    random_ipv4,
+    random_ipv6,
+    random_mac,
+    random_guid,
+    random_hex,
+    random_int,
+    random_float,
+)
+
+COUNT = 200
+
+
+@pytest.fixture(autouse=True)
+def seed():
+    random.seed(1)
+
+
+def test_faker_pool():
+    faker_pool = FakerPool()
+    with patch(
+        "pytest_splunk_addon.standard_lib.sample_generation.random_values.Faker",
+        side_effect=lambda locale: object(),
+    ) as faker_mock:
+        assert faker_pool.get() is faker_pool.get()
+        assert faker_pool.get("fr_FR") is not faker_pool.get()
+    assert faker_mock.call_count == 2
+
+
+@pytest.mark.parametrize("count", [0, 1, 5])
+def test_random_chunks(count):
+    chunks = random_chunks(3, count)
+    assert len(chunks) == count
+    assert all(len(chunk) == 3 for chunk in chunks)
+
+
+@pytest.mark.parametrize(
+    "generate",
+    [random_ipv4, random_ipv6, random_mac, random_guid, random_hex],
+)
+def test_seeded(generate):
+    values = generate(10)
+    random.seed(1)
+    assert generate(10) == values
+
+
+def test_random_ipv4():
+    addresses = [IPv4Address(each) for each in random_ipv4(COUNT)]
+    assert len(addresses) == COUNT
+    assert not any(
+        each.is_unspecified
+        or each.is_loopback
+        or each.is_link_local
+        or each.is_multicast
+        or each.is_reserved
+        for each in addresses
+    )
+
+
+def test_random_ipv4_drawn_again():
+    with patch(
+        "random.getrandbits", side_effect=[0x7F000001E0000001, 0x0A0000010A000002]
+    ):
+        assert random_ipv4(2) == ["10.0.0.1", "10.0.0.2"]
+
+
+def test_random_ipv6():
+    addresses = random_ipv6(COUNT)
+    assert len(addresses) == COUNT
+    assert all(int(IPv6Address(each)) >= 2 ** 32 for each in addresses)
+
+
+def test_random_mac():
+    addresses = random_mac(COUNT)
+    assert len(addresses) == COUNT
+    assert all(re.fullmatch(r"[0-9a-f]{2}(:[0-9a-f]{2}){5}", each) for each in addresses)
+    assert all(int(each[:2], 16) % 2 == 0 for each in addresses)
+
+
+def test_random_guid():
+    guids = random_guid(COUNT)
+    assert len(set(guids)) == COUNT
+    assert all(UUID(each).version == 4 for each in guids)
+
+
+@pytest.mark.parametrize("count", [0, 1, 16])
+def test_random_hex(count):
+    assert re.fullmatch("[0-9a-f]{{{}}}".format(count), random_hex(count))
+
+
+def test_random_int():
+    values = random_int(-2, 2, COUNT)
+    assert len(values) == COUNT
+    assert set(values) == {-2, -1, 0, 1, 2}
+
+
+def test_random_float():
+    values = random_float(1.5, 2.5, COUNT)
+    assert len(values) == COUNT
+    assert all(1.5 <= each < 2.5 for each in values)
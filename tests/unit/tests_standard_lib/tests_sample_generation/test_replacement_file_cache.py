@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from pytest_splunk_addon.standard_lib.sample_generation.replacement_file_cache import (
+    ReplacementFile,
+    ReplacementFileCache,
+)
+
+CSV_DATA = "header_1,header_2,header_1\n,data2\n  \n\nfield3,data3\n"
+
+
+class TestReplacementFile:
+    def test_lines(self):
+        assert ReplacementFile("one\n two \n  \n\nthree\n").lines == [
+            "one",
+            "two",
+            "",
+            "three",
+        ]
+
+    def test_data_and_rows(self):
+        replacement_file = ReplacementFile(CSV_DATA)
+        assert replacement_file.data == [
+            "header_1,header_2,header_1",
+            ",data2",
+            "field3,data3",
+        ]
+        assert replacement_file.rows[1] == ["", "data2"]
+
+    def test_lookup(self):
+        replacement_file = ReplacementFile(CSV_DATA)
+        assert replacement_file.header == "header_1,header_2,header_1\n"
+        assert replacement_file.lookup_data == [",data2", "field3,data3"]
+        assert replacement_file.lookup_rows == [["", "data2"], ["field3", "data3"]]
+        assert replacement_file.get_column_index("header_1") == 0
+        assert replacement_file.get_column_index("header_2") == 1
+        with pytest.raises(ValueError):
+            replacement_file.get_column_index("header_3")
+
+    def test_empty(self):
+        replacement_file = ReplacementFile("")
+        assert replacement_file.header == ""
+        assert replacement_file.lookup_data == []
+        assert replacement_file.data == []
+
+
+class TestReplacementFileCache:
+    def test_get_cached(self, tmp_path):
+        file_path = tmp_path / "values.txt"
+        file_path.write_text("one\ntwo")
+        cache = ReplacementFileCache()
+        replacement_file = cache.get(str(file_path))
+        assert replacement_file.lines == ["one", "two"]
+        assert cache.get(str(file_path)) is replacement_file
+
+    def test_get_modified(self, tmp_path):
+        file_path = tmp_path / "values.txt"
+        file_path.write_text("one\ntwo")
+        cache = ReplacementFileCache()
+        replacement_file = cache.get(str(file_path))
+        file_path.write_text("three")
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assert cache.get(str(file_path)) is not replacement_file
+        assert cache.get(str(file_path)).lines == ["three"]
+
+    def test_get_evicts_least_recently_used(self, tmp_path):
+        file_paths = []
+        for name in ("one", "two", "three"):
+            file_path = tmp_path / name
+            file_path.write_text("x" * 10)
+            file_paths.append(str(file_path))
+        cache = ReplacementFileCache(max_size=25)
+        first = cache.get(file_paths[0])
+        second = cache.get(file_paths[1])
+        assert cache.get(file_paths[0]) is first
+        cache.get(file_paths[2])
+        assert cache.get(file_paths[0]) is first
+        assert cache.get(file_paths[1]) is not second
+
+    def test_get_larger_than_cache(self, tmp_path):
+        file_path = tmp_path / "values.txt"
+        file_path.write_text("x" * 10)
+        cache = ReplacementFileCache(max_size=5)
+        assert cache.get(str(file_path)) is not cache.get(str(file_path))
+
+    def test_get_missing_file(self, tmp_path):
+        with pytest.raises(IOError):
+            ReplacementFileCache().get(str(tmp_path / "missing.txt"))
+
+    def test_clear(self, tmp_path):
+        file_path = tmp_path / "values.txt"
+        file_path.write_text("one")
+        cache = ReplacementFileCache()
+        replacement_file = cache.get(str(file_path))
+        cache.clear()
+        assert cache.get(str(file_path)) is not replacement_file
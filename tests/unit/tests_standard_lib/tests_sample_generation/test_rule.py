@@ -6,6 +6,10 @@ from freezegun import freeze_time
 from unittest.mock import MagicMock, call, patch, mock_open, ANY
 
 import pytest_splunk_addon.standard_lib.sample_generation.rule
+from pytest_splunk_addon.standard_lib.sample_generation.value_counter import (
+    ValueCounter,
+    DEFAULT_VALUE_COUNTER,
+)
 
 TOKEN_DATA = "token_data"
 FIELD = "Field"
@@ -44,6 +48,7 @@ ELEM_1 = "elem_1"
 ELEM_2 = "elem_2"
 ELEM_3 = "elem_3"
 DUMMY_FILE_PATH = "/dummy/path/to/file"
+VALUE_COUNTER = "Value_counter"
 
 TokenValue = namedtuple("TokenValue", ["value"])
 token_value = namedtuple("token_value", ["key", "value"])
@@ -116,7 +121,9 @@ def event():
 class TestRule:
     @pytest.fixture
     def rule(self):
-        return pytest_splunk_addon.standard_lib.sample_generation.rule.Rule(token())
+        return pytest_splunk_addon.standard_lib.sample_generation.rule.Rule(
+            token(), value_counter=ValueCounter()
+        )
 
     @pytest.fixture
     def mock_class(self, monkeypatch):
@@ -175,8 +182,13 @@ class TestRule:
     )
     def test_parse_rule(self, rule, mock_class, rule_name, _token, params, params_dict):
         static_mock = mock_class(rule_name)
-        assert rule.parse_rule(_token, PSA_DATA_PARAMS, SAMPLE_PATH) == RETURN_VALUE
-        static_mock.assert_called_once_with(*params, **params_dict)
+        assert (
+            rule.parse_rule(_token, PSA_DATA_PARAMS, SAMPLE_PATH, VALUE_COUNTER)
+            == RETURN_VALUE
+        )
+        static_mock.assert_called_once_with(
+            *params, value_counter=VALUE_COUNTER, **params_dict
+        )
 
     def test_parse_rule_other_repl_type(self, rule):
         assert (
@@ -197,17 +209,18 @@ class TestRule:
         token_values = [[TokenValue(1)], [TokenValue(2)]]
         replace_mock.side_effect = token_values
         rule = pytest_splunk_addon.standard_lib.sample_generation.rule.Rule(
-            token(replacement_type=ALL)
+            token(replacement_type=ALL), value_counter=ValueCounter()
         )
         rule.replace = replace_mock
         event1 = event()
         event2 = event()
         events = [event1, event2]
         assert rule.apply(events) == [return_event_1, return_event_2]
-        assert (
-            pytest_splunk_addon.standard_lib.sample_generation.rule.event_host_count
-            == 2
-        )
+        assert rule.value_counter.counts["event_host"] == 2
+        assert return_event_1.metadata.__setitem__.call_args_list == [
+            call("host", "Sample-name-1"),
+            call("id", "Sample_name_1"),
+        ]
         for e, tv in zip(
             [return_event_1, return_event_2], [TokenValue(1), TokenValue(2)]
         ):
@@ -233,6 +246,24 @@ class TestRule:
         assert not event3.replace_token.called
         assert not event3.register_field_value.called
 
+    def test_apply_batched_values(self, event):
+        rule = pytest_splunk_addon.standard_lib.sample_generation.rule.Rule(
+            token(replacement_type=RANDOM)
+        )
+        rule.replace = MagicMock()
+        rule.get_values = MagicMock(return_value=[1, 2, 3])
+        event1 = event(token_count=2)
+        event2 = event(token_count=0)
+        event3 = event()
+        assert rule.apply([event1, event2, event3]) == [event1, event2, event3]
+        rule.get_values.assert_called_once_with(3)
+        assert not rule.replace.called
+        event1.replace_token.assert_called_once_with(
+            TOKEN_DATA, [token_value(1, 1), token_value(2, 2)]
+        )
+        assert not event2.replace_token.called
+        event3.replace_token.assert_called_once_with(TOKEN_DATA, [token_value(3, 3)])
+
     def test_get_lookup_value(self, rule, event):
         eve = event()
         test_key = "test_key"
@@ -254,9 +285,7 @@ class TestRule:
                 index_list,
                 csv,
             )
-            pytest_splunk_addon.standard_lib.sample_generation.rule.user_email_count = (
-                email_count
-            )
+            assert rule.value_counter.counts["user_email"] == email_count
             assert eve.replacement_map == {test_key: result_csv}
 
         csv_row_1 = create_csv("1")
@@ -282,22 +311,24 @@ class TestRule:
         assert rule.get_rule_replacement_values(sample, value_list, ANY) == expected
 
     def test_clean_rules(self, rule):
-        pytest_splunk_addon.standard_lib.sample_generation.rule.event_host_count = 25
-        assert (
-            pytest_splunk_addon.standard_lib.sample_generation.rule.event_host_count
-            == 25
-        )
+        DEFAULT_VALUE_COUNTER.counts["event_host"] = 25
+        assert DEFAULT_VALUE_COUNTER.next_value("event_host") == 26
+        rule.clean_rules()
+        assert DEFAULT_VALUE_COUNTER.next_value("event_host") == 1
         rule.clean_rules()
-        assert (
-            pytest_splunk_addon.standard_lib.sample_generation.rule.event_host_count
-            == 0
-        )
 
 
 @pytest.mark.parametrize(
     "repl_type, repl, expected, class_name, to_mock, ret_value",
     [
-        (RANDOM, "integer[30:212]", ([44, 44], [44, 44]), INT, "randint", 44),
+        (
+            RANDOM,
+            "integer[30:212]",
+            ([44, 44], [44, 44]),
+            INT,
+            "random_int",
+            [44, 44],
+        ),
         (
             ALL,
             "Integer[4:7]",
@@ -311,16 +342,16 @@ class TestRule:
             "float[13.55:664.545]",
             ([22.33, 22.33], [22.33, 22.33]),
             FLOAT,
-            "uniform",
-            22.331,
+            "random_float",
+            [22.331, 22.331],
         ),
         (
             RANDOM,
             "Float[13:664.545]",
             ([22.3, 22.3], [22.3, 22.3]),
             FLOAT,
-            "uniform",
-            22.331,
+            "random_float",
+            [22.331, 22.331],
         ),
         (
             RANDOM,
@@ -364,17 +395,17 @@ def test_rule(
 
 
 @pytest.mark.parametrize(
-    "class_name, return_value",
+    "class_name, to_mock, return_value",
     [
-        (IPV4_LOWER, "192.168.1.1"),
-        (IPV6_LOWER, "2001:0db8:0000:0000:0000:ff00:0042:8329"),
-        (MAC_ADDRESS, "AA-00-04-00-XX-YY"),
+        (IPV4_LOWER, "random_ipv4", "192.168.1.1"),
+        (IPV6_LOWER, "random_ipv6", "2001:0db8:0000:0000:0000:ff00:0042:8329"),
+        (MAC_ADDRESS, "random_mac", "AA-00-04-00-XX-YY"),
     ],
 )
-def test_ip_rule(event, class_name, return_value):
+def test_ip_rule(event, class_name, to_mock, return_value):
     eve = event()
     rule = get_rule_class(class_name)(token())
-    with patch.object(rule.fake, class_name, MagicMock(return_value=return_value)):
+    with get_patch(to_mock, [return_value] * 2):
         assert list(rule.replace(eve, 2)) == [
             token_value(key=return_value, value=return_value),
             token_value(key=return_value, value=return_value),
@@ -384,8 +415,10 @@ def test_ip_rule(event, class_name, return_value):
 def test_guid_rule(event):
     eve = event()
     rule = get_rule_class(GUID)(token())
-    _uuid = "123e4567-e89b-12d3-a456-426614174000"
-    with get_patch("uuid.uuid4", _uuid):
+    _uuid = "123e4567-e89b-42d3-a456-426614174000"
+    # Same 128 bits for both the guids
+    random_bits = 0x123E4567E89B12D3A456426614174000 * (2 ** 128 + 1)
+    with get_patch("random.getrandbits", random_bits):
         assert list(rule.replace(eve, 2)) == [
             token_value(key=_uuid, value=_uuid),
             token_value(key=_uuid, value=_uuid),
@@ -1051,5 +1084,5 @@ class TestHexRule:
     def test_replace(self, event, replacement, expected):
         eve = event()
         rule = get_rule_class(HEX)(token(replacement=replacement))
-        with get_patch("randint", 8):
+        with get_patch("random.getrandbits", 0x888888):
             assert list(rule.replace(eve, 2)) == expected
@@ -4,6 +4,10 @@ from collections import namedtuple
 from unittest.mock import patch, MagicMock
 
 import pytest_splunk_addon.standard_lib.sample_generation.sample_event
+import pytest_splunk_addon.standard_lib.sample_generation.token_matcher
+from pytest_splunk_addon.standard_lib.sample_generation.value_counter import (
+    ValueCounter,
+)
 
 EVENT_STRING = "Event_string dad ad dfd ddas Value_5."
 UPDATED_STRING = "Updated_string"
@@ -23,8 +27,10 @@ def samp_eve():
     ip_mock = MagicMock()
     ip_mock.ipv4.return_value = FAKE_IPV4
     ip_mock.ipv6.return_value = FAKE_IPV6
-    with patch("faker.Faker") as faker_mock:
-        faker_mock.return_value = ip_mock
+    with patch(
+        "pytest_splunk_addon.standard_lib.sample_generation.random_values.FAKER_POOL"
+    ) as faker_pool_mock:
+        faker_pool_mock.get.return_value = ip_mock
         importlib.reload(
             pytest_splunk_addon.standard_lib.sample_generation.sample_event
         )
@@ -32,21 +38,16 @@ def samp_eve():
         event_string=EVENT_STRING,
         metadata=METADATA,
         sample_name=SAMPLE_NAME,
+        value_counter=ValueCounter(),
     )
 
 
-def check_host_count(value):
-    assert (
-        pytest_splunk_addon.standard_lib.sample_generation.sample_event.host_count
-        == value
-    )
+def check_host_count(samp_eve, value):
+    assert samp_eve.value_counter.counts.get("host", 0) == value
 
 
-def check_fqdn_count(value):
-    assert (
-        pytest_splunk_addon.standard_lib.sample_generation.sample_event.fqdn_count
-        == value
-    )
+def check_fqdn_count(samp_eve, value):
+    assert samp_eve.value_counter.counts.get("fqdn", 0) == value
 
 
 def test_update(samp_eve):
@@ -57,62 +58,54 @@ def test_update(samp_eve):
 
 def test_get_host(samp_eve):
     assert samp_eve.get_host() == f"host-{SAMPLE_NAME}-1"
-    check_host_count(1)
+    check_host_count(samp_eve, 1)
     assert samp_eve.host_count == 0
     assert samp_eve.get_host() == f"host-{SAMPLE_NAME}-2"
-    check_host_count(2)
+    check_host_count(samp_eve, 2)
     assert samp_eve.host_count == 0
 
 
 def test_get_field_host(samp_eve):
-    check_host_count(0)
+    check_host_count(samp_eve, 0)
     assert samp_eve.get_field_host(RULE) == f"{RULE}-{SAMPLE_HOST}1"
-    check_host_count(1)
+    check_host_count(samp_eve, 1)
 
 
 def test_get_field_fqdn(samp_eve):
-    check_fqdn_count(0)
+    check_fqdn_count(samp_eve, 0)
     assert samp_eve.get_field_fqdn(RULE) == f"{RULE}_{SAMPLE_HOST}.sample_domain1.com"
-    check_fqdn_count(1)
+    check_fqdn_count(samp_eve, 1)
 
 
 def test_get_ipv4(samp_eve):
     # that test might be divided into many smaller tests,
     # but feels natural to write it this way
-    module = pytest_splunk_addon.standard_lib.sample_generation.sample_event
+    counts = samp_eve.value_counter.counts
     rule = "src"
     assert samp_eve.get_ipv4(rule) == "10.1.0.1"
-    assert module.src_ipv4 == 1
-    module.src_ipv4 = 270
+    assert counts["src_ipv4"] == 1
+    counts["src_ipv4"] = 270
     assert samp_eve.get_ipv4(rule) == "10.1.1.15"
-    assert module.src_ipv4 == 271
+    assert counts["src_ipv4"] == 271
     rule = "host"
     assert samp_eve.get_ipv4(rule) == "172.16.51.0"
-    assert module.host_ipv4_octet_count == 0
-    assert module.host_ipv4 == 51
-    module.host_ipv4_octet_count = 260
+    assert counts["host_ipv4"] == 1
+    counts["host_ipv4"] = 261
     assert samp_eve.get_ipv4(rule) == "172.16.52.5"
-    assert module.host_ipv4_octet_count == 5
-    assert module.host_ipv4 == 52
-    module.host_ipv4 = 101
+    counts["host_ipv4"] = 50 * 256 + 6
     assert samp_eve.get_ipv4(rule) == "172.16.51.6"
-    assert module.host_ipv4_octet_count == 6
-    assert module.host_ipv4 == 51
     rule = "dvc"
     assert samp_eve.get_ipv4(rule) == "172.16.1.1"
-    assert module.dvc_ipv4 == 1
-    assert module.dvc_ipv4_octet_count == 1
-    module.dvc_ipv4 = 80
-    module.dvc_ipv4_octet_count = 300
+    assert counts["dvc_ipv4"] == 1
+    counts["dvc_ipv4"] = 9260
     assert samp_eve.get_ipv4(rule) == "172.16.30.45"
-    assert module.dvc_ipv4 == 81
-    assert module.dvc_ipv4_octet_count == 301
+    assert counts["dvc_ipv4"] == 9261
     rule = "dest"
     assert samp_eve.get_ipv4(rule) == "10.100.0.1"
-    assert module.dest_ipv4 == 1
+    assert counts["dest_ipv4"] == 1
     rule = "url"
     assert samp_eve.get_ipv4(rule) == "192.168.0.1"
-    assert module.url_ip_count == 1
+    assert counts["url_ipv4"] == 1
     rule = "else"
     assert samp_eve.get_ipv4(rule) == FAKE_IPV4
 
@@ -120,19 +113,20 @@ def test_get_ipv4(samp_eve):
 def test_get_ipv6(samp_eve):
     # that test might be divided into many smaller tests,
     # but feels natural to write it this way
-    module = pytest_splunk_addon.standard_lib.sample_generation.sample_event
+    counts = samp_eve.value_counter.counts
     rule = "src"
     assert samp_eve.get_ipv6(rule) == "fdee:1fe4:2b8c:3261:0000:0000:0000:0000"
-    assert module.src_ipv6 == 1
+    assert counts["src_ipv6"] == 1
+    assert samp_eve.get_ipv6(rule) == "fdee:1fe4:2b8c:3261:0000:0000:0000:0001"
     rule = "host"
     assert samp_eve.get_ipv6(rule) == "fdee:1fe4:2b8c:3264:0000:0000:0000:0000"
-    assert module.host_ipv6 == 1
+    assert counts["host_ipv6"] == 1
     rule = "dvc"
     assert samp_eve.get_ipv6(rule) == "fdee:1fe4:2b8c:3263:0000:0000:0000:0000"
-    assert module.dvc_ipv6 == 1
+    assert counts["dvc_ipv6"] == 1
     rule = "dest"
     assert samp_eve.get_ipv6(rule) == "fdee:1fe4:2b8c:3262:0000:0000:0000:0000"
-    assert module.dest_ipv6 == 1
+    assert counts["dest_ipv6"] == 1
     rule = "else"
     assert samp_eve.get_ipv6(rule) == FAKE_IPV6
 
@@ -154,6 +148,27 @@ def test_replace_token(samp_eve):
     assert samp_eve.event == f"Event_string {VALUE_1} {VALUE_2} dfd ddas {VALUE_1}"
 
 
+def test_replace_token_after_scan(samp_eve):
+    matcher = pytest_splunk_addon.standard_lib.sample_generation.token_matcher.TokenMatcher(
+        ["d?ad", r"Value_[1-9]?\."]
+    )
+    TokenValue = namedtuple("TokenValue", ["value"])
+    samp_eve.scan_tokens(matcher)
+    assert samp_eve.get_token_count("d?ad") == 2
+    samp_eve.replace_token("d?ad", [TokenValue(VALUE_1), TokenValue(VALUE_2)])
+    assert samp_eve.get_token_count("d?ad") == 0
+    new_eve = pytest_splunk_addon.standard_lib.sample_generation.sample_event.SampleEvent.copy(
+        samp_eve
+    )
+    new_eve.replace_token(r"Value_[1-9]?\.", "end_value")
+    assert samp_eve.event == EVENT_STRING
+    samp_eve.apply_replacements()
+    new_eve.apply_replacements()
+    assert samp_eve.event == f"Event_string {VALUE_1} {VALUE_2} dfd ddas Value_5."
+    assert new_eve.event == f"Event_string {VALUE_1} {VALUE_2} dfd ddas end_value"
+    assert samp_eve.token_spans is None
+
+
 def test_register_field_value(samp_eve, monkeypatch):
     field_1 = "field1"
     field_2 = "field2"
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, patch, call
 
 from pytest_splunk_addon.standard_lib.sample_generation.sample_generator import (
     SampleGenerator,
@@ -19,6 +19,7 @@ class TestSampleGenerator:
         assert sg.addon_path == ADDON_PATH
         assert sg.config_path == CONFIG_PATH
         assert sg.process_count == 2
+        assert sg.seed is None
 
     def test_get_samples(self):
         tks_1 = "tokenized_sample_1"
@@ -36,9 +37,76 @@ class TestSampleGenerator:
             sample_stanza_mock.get_raw_events = ["event_1", "event_2"]
             sample_stanza_mock.tokenize = lambda x, y: (x, y)
             psa_data_mock.conf_name = CONFIG_PATH
-            sg = SampleGenerator(ADDON_PATH)
+            sg = SampleGenerator(ADDON_PATH, process_count=1)
             assert list(sg.get_samples()) == [tks_1, tks_2, tks_1, tks_2]
 
+    def test_get_samples_in_processes(self):
+        sample_mocks = [MagicMock() for _ in range(3)]
+        for i, sample_mock in enumerate(sample_mocks):
+            sample_mock.get_tokenized_events.return_value = [f"tokenized_sample_{i}"]
+        psa_data_mock = MagicMock()
+        psa_data_mock.get_sample_stanzas.return_value = sample_mocks
+        psa_data_mock.conf_name = "psa-data-gen"
+        executor_mock = MagicMock()
+        executor_mock.__enter__.return_value = executor_mock
+        executor_mock.map.side_effect = lambda func, *iterables: [
+            func(*args) for args in zip(*iterables)
+        ]
+        with patch(
+            f"{MODULE_PATH}.PytestSplunkAddonDataParser",
+            MagicMock(return_value=psa_data_mock),
+        ), patch(
+            f"{MODULE_PATH}.ProcessPoolExecutor",
+            MagicMock(return_value=executor_mock),
+        ) as process_pool_mock, patch(
+            f"{MODULE_PATH}.ValueCounter"
+        ) as value_counter_mock:
+            SampleGenerator.clean_samples()
+            sg = SampleGenerator(ADDON_PATH, process_count=2, seed=7)
+            assert list(sg.get_samples()) == [
+                "tokenized_sample_0",
+                "tokenized_sample_1",
+                "tokenized_sample_2",
+            ]
+            process_pool_mock.assert_called_once_with(2)
+            value_counter_mock.assert_called_once_with(7)
+            value_counter = value_counter_mock.return_value
+            psa_data_mock.get_sample_stanzas.assert_called_once_with(value_counter)
+            assert value_counter.set_shard.call_args_list == [call(0, 2), call(1, 2)]
+            assert value_counter.seed_random.call_count == 2
+            for sample_mock in sample_mocks:
+                sample_mock.tokenize.assert_called_once_with("psa-data-gen")
+        SampleGenerator.clean_samples()
+
+    def test_get_samples_with_cache(self):
+        sample_mock_1 = MagicMock(sample_name="sample_1")
+        sample_mock_2 = MagicMock(sample_name="sample_2")
+        cached_mock = MagicMock()
+        cached_mock.get_tokenized_events.return_value = ["cached_sample_1"]
+        sample_mock_2.get_tokenized_events.return_value = ["tokenized_sample_2"]
+        psa_data_mock = MagicMock()
+        psa_data_mock.get_sample_stanzas.return_value = [sample_mock_1, sample_mock_2]
+        psa_data_mock.conf_name = "psa-data-gen"
+        cache_mock = MagicMock()
+        cache_mock.get_key.side_effect = ["key_1", "key_2"]
+        cache_mock.load.side_effect = [cached_mock, None]
+        with patch(
+            f"{MODULE_PATH}.PytestSplunkAddonDataParser",
+            MagicMock(return_value=psa_data_mock),
+        ), patch(f"{MODULE_PATH}.SampleStanza") as sample_stanza_mock:
+            SampleGenerator.clean_samples()
+            sg = SampleGenerator(ADDON_PATH, process_count=1, cache=cache_mock)
+            assert list(sg.get_samples()) == ["cached_sample_1", "tokenized_sample_2"]
+            assert cache_mock.load.call_args_list == [
+                call("sample_1", "key_1"),
+                call("sample_2", "key_2"),
+            ]
+            sample_stanza_mock.tokenize.assert_called_once_with(
+                sample_mock_2, "psa-data-gen"
+            )
+            cache_mock.store.assert_called_once_with("key_2", sample_mock_2)
+        SampleGenerator.clean_samples()
+
     def test_clean_samples(self):
         SampleGenerator.sample_stanzas = [10]
         SampleGenerator.conf_name = "conf_name"
@@ -254,7 +254,9 @@ class TestSampleStanza:
             MagicMock(return_value="sample_event"),
         ) as sample_event_mock:
             assert list(ss._get_raw_sample()) == ["sample_event"]
-            sample_event_mock.assert_called_with(*sample_event_params)
+            sample_event_mock.assert_called_with(
+                *sample_event_params, value_counter=None
+            )
 
     def test_get_raw_sample_empty_event(self, sample_stanza):
         ss = sample_stanza(
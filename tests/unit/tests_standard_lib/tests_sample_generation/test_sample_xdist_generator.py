@@ -73,29 +73,49 @@ class TestSampleXdistGenerator:
     @patch(
         "pytest_splunk_addon.standard_lib.sample_generation.sample_xdist_generator.pickle"
     )
+    @patch(
+        "pytest_splunk_addon.standard_lib.sample_generation.sample_xdist_generator.EventStore"
+    )
     @pytest.mark.parametrize(
-        "exists_value, environ, expected",
+        "exists_value, environ, expected, write_calls",
         [
             (
                 True,
                 {"PYTEST_XDIST_WORKER": "", "PYTEST_XDIST_TESTRUNUID": "fake_id"},
-                "pickle_loaded",
+                {"conf_name": "stored_conf_name", "tokenized_events": "event_store"},
+                [],
             ),
             (
                 False,
                 {"PYTEST_XDIST_WORKER": "", "PYTEST_XDIST_TESTRUNUID": "fake_id"},
-                {"conf_name": "conf_name", "tokenized_events": []},
+                {"conf_name": "stored_conf_name", "tokenized_events": "event_store"},
+                [call("fake_id_events", "conf_name", [])],
             ),
             (
                 False,
                 {"PYTEST_XDIST_TESTRUNUID": "fake_id"},
                 {"conf_name": "conf_name", "tokenized_events": []},
+                [],
             ),
         ],
     )
-    def test_get_samples(self, pickle_mock, exists_value, environ, expected):
-        pickle_mock.load.return_value = "pickle_loaded"
+    def test_get_samples(
+        self,
+        event_store_mock,
+        pickle_mock,
+        exists_value,
+        environ,
+        expected,
+        write_calls,
+    ):
+        event_store = MagicMock()
+        event_store.conf_name = "stored_conf_name"
+        event_store_mock.return_value = event_store
+        expected = dict(expected)
+        if expected["tokenized_events"] == "event_store":
+            expected["tokenized_events"] = event_store
         sample_xdist_generator = SampleXdistGenerator("path")
+        sample_xdist_generator.tokenized_event_source = "new"
         sample_xdist_generator.store_events = MagicMock()
         with patch("os.path.exists", MagicMock(return_value=exists_value)), patch(
             "os.environ",
@@ -105,8 +125,28 @@ class TestSampleXdistGenerator:
             MagicMock(),
         ) as sample_generator_mock:
             sample_generator_mock.conf_name = "conf_name"
-            sample_generator_mock.tokenized_events = "tokenized_events"
+            sample_generator_mock.return_value.get_samples.return_value = []
             assert sample_xdist_generator.get_samples(True) == expected
+            assert event_store_mock.write.call_args_list == write_calls
+            pickle_mock.dump.assert_not_called()
+
+    def test_get_samples_stream(self):
+        sample_xdist_generator = SampleXdistGenerator("path")
+        sample_xdist_generator.tokenized_event_source = "new"
+        sample_xdist_generator.store_events = MagicMock()
+        with patch("os.environ", {}), patch(
+            "pytest_splunk_addon.standard_lib.sample_generation.sample_xdist_generator.SampleGenerator",
+            MagicMock(),
+        ) as sample_generator_mock:
+            sample_generator_mock.return_value.get_samples.side_effect = lambda: iter(
+                tokenized_events
+            )
+            store_sample = sample_xdist_generator.get_samples(True, stream=True)
+            events = store_sample["tokenized_events"]
+            assert not isinstance(events, list)
+            assert list(events) == tokenized_events
+            assert list(events) == tokenized_events
+            sample_xdist_generator.store_events.assert_called_once_with(events)
 
     @pytest.mark.parametrize(
         "exists_value, makedirs_calls",
@@ -0,0 +1,59 @@
+import pytest
+
+from pytest_splunk_addon.standard_lib.sample_generation.token_matcher import (
+    TokenMatcher,
+)
+
+EVENT_STRING = "user=##user## src=##src## user=##user## 12.34 from host"
+
+
+class TestTokenMatcher:
+    @pytest.mark.parametrize(
+        "tokens",
+        [
+            [],
+            None,
+            ["##user##", None],
+            [r"(a)\1"],
+            ["(?P<name>a)", "(?P<name>b)"],
+        ],
+    )
+    def test_compile_not_possible(self, tokens):
+        assert TokenMatcher.compile(tokens) is None
+
+    def test_scan(self):
+        matcher = TokenMatcher.compile(
+            ["##user##", "##src##", r"(\d+\.\d+) from", "##missing##"]
+        )
+        assert matcher.scan(EVENT_STRING) == {
+            "##user##": [(5, 13), (31, 39)],
+            "##src##": [(18, 25)],
+            r"(\d+\.\d+) from": [(40, 45)],
+            "##missing##": [],
+        }
+
+    def test_scan_duplicate_tokens(self):
+        matcher = TokenMatcher.compile(["##user##", "##user##"])
+        assert matcher.tokens == ["##user##"]
+        assert matcher.scan(EVENT_STRING) == {"##user##": [(5, 13), (31, 39)]}
+
+    def test_scan_optional_group(self):
+        matcher = TokenMatcher.compile([r"src=(#)?#src##"])
+        assert matcher.scan("src=#src##") == {r"src=(#)?#src##": [(0, 10)]}
+
+    @pytest.mark.parametrize(
+        "replacements, expected",
+        [
+            ([], EVENT_STRING),
+            (
+                [(31, 39, "bob"), (5, 13, "alice"), (18, 25, 1)],
+                "user=alice src=1 user=bob 12.34 from host",
+            ),
+            (
+                [(5, 13, "alice"), (5, 13, "bob")],
+                "user=alice src=##src## user=##user## 12.34 from host",
+            ),
+        ],
+    )
+    def test_substitute(self, replacements, expected):
+        assert TokenMatcher.substitute(EVENT_STRING, replacements) == expected
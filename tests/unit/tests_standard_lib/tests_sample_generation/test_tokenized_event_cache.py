@@ -0,0 +1,78 @@
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pytest_splunk_addon.standard_lib.sample_generation.rule import FileRule
+from pytest_splunk_addon.standard_lib.sample_generation.tokenized_event_cache import (
+    TokenizedEventCache,
+)
+
+MODULE_PATH = "pytest_splunk_addon.standard_lib.sample_generation.tokenized_event_cache"
+SAMPLE_NAME = "sample.log"
+
+
+@pytest.fixture
+def sample_stanza(tmp_path):
+    sample_path = tmp_path / SAMPLE_NAME
+    sample_path.write_text("event ##token##")
+    replacement_path = tmp_path / "replacement.txt"
+    replacement_path.write_text("value_1")
+    file_rule = MagicMock(spec=FileRule)
+    file_rule.get_file_path.return_value = (str(replacement_path), None)
+    return SimpleNamespace(
+        sample_name=SAMPLE_NAME,
+        sample_path=str(sample_path),
+        psa_data_params={"tokens": {"token_1": {"token": "##token##"}}},
+        sample_rules=[MagicMock(), file_rule],
+        tokenized_events=["tokenized_event"],
+    )
+
+
+class TestTokenizedEventCache:
+    def test_get_key(self, tmp_path, sample_stanza):
+        cache = TokenizedEventCache(str(tmp_path / "cache"))
+        key = cache.get_key(sample_stanza)
+        assert key == cache.get_key(sample_stanza)
+        assert key != cache.get_key(sample_stanza, seed=1)
+        with patch(f"{MODULE_PATH}.__version__", "0.0.0"):
+            assert key != cache.get_key(sample_stanza)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda tmp_path, stanza: (tmp_path / SAMPLE_NAME).write_text("new"),
+            lambda tmp_path, stanza: (tmp_path / "replacement.txt").write_text("new"),
+            lambda tmp_path, stanza: (tmp_path / "replacement.txt").unlink(),
+            lambda tmp_path, stanza: stanza.psa_data_params.update(breaker="\n"),
+        ],
+    )
+    def test_get_key_changed_input(self, tmp_path, sample_stanza, change):
+        cache = TokenizedEventCache(str(tmp_path / "cache"))
+        key = cache.get_key(sample_stanza)
+        change(tmp_path, sample_stanza)
+        assert key != cache.get_key(sample_stanza)
+
+    def test_store_and_load(self, tmp_path, sample_stanza):
+        cache = TokenizedEventCache(str(tmp_path / "cache"))
+        sample_stanza.sample_rules = []
+        assert cache.load(SAMPLE_NAME, "key_1") is None
+        cache.store("key_1", sample_stanza)
+        assert cache.load(SAMPLE_NAME, "key_1") == sample_stanza
+        assert cache.load(SAMPLE_NAME, "key_2") is None
+        assert os.listdir(tmp_path / "cache") == [f"{SAMPLE_NAME}.pickle"]
+
+    def test_load_corrupted(self, tmp_path, caplog):
+        (tmp_path / f"{SAMPLE_NAME}.pickle").write_text("not a pickle")
+        cache = TokenizedEventCache(str(tmp_path))
+        assert cache.load(SAMPLE_NAME, "key_1") is None
+        assert "Could not read the cached events of sample.log" in caplog.text
+
+    def test_store_not_picklable(self, tmp_path, sample_stanza, caplog):
+        cache = TokenizedEventCache(str(tmp_path))
+        sample_stanza.sample_rules = []
+        sample_stanza.tokenized_events = [lambda: None]
+        cache.store("key_1", sample_stanza)
+        assert "Could not cache the events of sample.log" in caplog.text
+        assert sorted(os.listdir(tmp_path)) == ["replacement.txt", SAMPLE_NAME]
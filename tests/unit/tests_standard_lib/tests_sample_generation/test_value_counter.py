@@ -0,0 +1,49 @@
+import random
+from unittest.mock import patch
+
+from pytest_splunk_addon.standard_lib.sample_generation.value_counter import (
+    ValueCounter,
+)
+
+MODULE_PATH = "pytest_splunk_addon.standard_lib.sample_generation.value_counter"
+
+
+class TestValueCounter:
+    def test_next_value(self):
+        value_counter = ValueCounter()
+        assert [value_counter.next_value("host") for _ in range(3)] == [1, 2, 3]
+        assert value_counter.next_value("fqdn") == 1
+        value_counter.reset()
+        assert value_counter.next_value("host") == 1
+
+    def test_next_value_shards_are_disjoint(self):
+        values = []
+        for shard in range(3):
+            value_counter = ValueCounter(shard=shard, shard_count=3)
+            values.extend(value_counter.next_value("host") for _ in range(4))
+        assert sorted(values) == list(range(1, 13))
+
+    def test_set_shard(self):
+        value_counter = ValueCounter()
+        value_counter.next_value("host")
+        value_counter.set_shard(1, 4)
+        assert value_counter.next_value("host") == 2
+        assert value_counter.next_value("host") == 6
+
+    def test_seed_random(self):
+        value_counter = ValueCounter(seed=10, shard=1, shard_count=2)
+        value_counter.seed_random()
+        first = [random.random() for _ in range(3)]
+        value_counter.seed_random()
+        assert [random.random() for _ in range(3)] == first
+        value_counter.set_shard(0, 2)
+        value_counter.seed_random()
+        assert [random.random() for _ in range(3)] != first
+
+    def test_seed_random_without_seed(self):
+        with patch(f"{MODULE_PATH}.random.seed") as seed_mock, patch(
+            f"{MODULE_PATH}.Faker.seed"
+        ) as faker_seed_mock:
+            ValueCounter().seed_random()
+            seed_mock.assert_not_called()
+            faker_seed_mock.assert_not_called()